@@ -1,17 +1,13 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional, Protocol
 
 from config import settings
-
-try:
-    from openai import OpenAI
-except Exception:  # pragma: no cover - optional dependency
-    OpenAI = None
-
+from instrumentation.hooks import HOOKS, emit
 
 logger = logging.getLogger(__name__)
 
@@ -23,42 +19,140 @@ class Message:
     timestamp: datetime
 
 
+class LLMBackend(Protocol):
+    def stream(self, messages: List[Message]) -> Iterator[str]:
+        ...
+
+    def astream(self, messages: List[Message]) -> AsyncIterator[str]:
+        ...
+
+
+class OpenAIBackend:
+    """OpenAI Chat Completions 스트리밍 백엔드. openai 패키지는 선택될 때만 import한다."""
+
+    def __init__(self) -> None:
+        try:
+            from openai import AsyncOpenAI, OpenAI
+        except Exception:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "openai is required for the OpenAI provider. Install it with `pip install openai`."
+            )
+        if not settings.OPENAI_API_KEY:
+            raise RuntimeError("OPENAI_API_KEY is not set.")
+        self._client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self._async_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+    def stream(self, messages: List[Message]) -> Iterator[str]:
+        response = self._client.chat.completions.create(**_completion_args(messages))
+        for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    async def astream(self, messages: List[Message]) -> AsyncIterator[str]:
+        response = await self._async_client.chat.completions.create(**_completion_args(messages))
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+
 class LLMClient:
-    """OpenAI 기반 LLM을 호출하거나 연결이 없을 때 목업 응답을 반환한다."""
+    """설정된 LLM 백엔드를 호출하거나 연결이 없을 때 목업 응답을 반환한다."""
 
     def __init__(self) -> None:
+        from config.backends import LLM_BACKENDS
+
         self._provider = settings.LLM_PROVIDER.lower()
-        self._client = None
-        if self._provider == "openai" and settings.OPENAI_API_KEY and OpenAI:
-            self._client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        if self._client is None:
+        self._backend: Optional[LLMBackend] = None
+        if self._provider == "mock":
+            logger.info("목업 LLM 응답을 사용합니다.")
+            return
+        try:
+            self._backend = LLM_BACKENDS.create(self._provider)
+        except Exception as exc:
             logger.warning(
-                "실제 LLM 자격 증명이 없거나 openai 패키지를 찾을 수 없어 목업 응답으로 대체합니다."
+                "실제 LLM 자격 증명이 없거나 백엔드(%s)를 불러올 수 없어 목업 응답으로 대체합니다: %s",
+                self._provider,
+                exc,
             )
 
     def complete(self, messages: List[Message]) -> str:
         return "".join(self.stream_complete(messages)).strip()
 
-    def stream_complete(self, messages: List[Message]):
+    def stream_complete(self, messages: List[Message]) -> Iterator[str]:
         """LLM 스트림을 생성해 토큰을 순차적으로 전달한다."""
-        if self._client:
+        stream = self._stream_complete(messages)
+        if HOOKS.llm_first_token or HOOKS.llm_last_token:
+            return _instrument_stream(stream)
+        return stream
+
+    def _stream_complete(self, messages: List[Message]) -> Iterator[str]:
+        if self._backend:
             try:
-                response = self._client.chat.completions.create(
-                    model=settings.OPENAI_MODEL,
-                    temperature=settings.LLM_TEMPERATURE,
-                    messages=[{"role": msg.role, "content": msg.content} for msg in messages],
-                    stream=True,
-                )
-                for chunk in response:
-                    delta = chunk.choices[0].delta.content
-                    if delta:
-                        yield delta
+                yield from self._backend.stream(messages)
                 return
             except Exception as exc:  # pragma: no cover - network failure
                 logger.exception("LLM 호출이 실패했습니다. 목업 응답으로 대체합니다: %s", exc)
 
         yield from _mock_response_stream(messages)
 
+    def astream_complete(self, messages: List[Message]) -> AsyncIterator[str]:
+        """stream_complete()의 asyncio 버전. 이벤트 루프를 막지 않고 토큰을 전달한다."""
+        stream = self._astream_complete(messages)
+        if HOOKS.llm_first_token or HOOKS.llm_last_token:
+            return _instrument_astream(stream)
+        return stream
+
+    async def _astream_complete(self, messages: List[Message]) -> AsyncIterator[str]:
+        if self._backend:
+            try:
+                async for chunk in self._backend.astream(messages):
+                    yield chunk
+                return
+            except Exception as exc:  # pragma: no cover - network failure
+                logger.exception("LLM 호출이 실패했습니다. 목업 응답으로 대체합니다: %s", exc)
+
+        for chunk in _mock_response_stream(messages):
+            yield chunk
+
+
+def _completion_args(messages: List[Message]) -> dict:
+    return {
+        "model": settings.OPENAI_MODEL,
+        "temperature": settings.LLM_TEMPERATURE,
+        "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+        "stream": True,
+    }
+
+
+def _instrument_stream(stream: Iterator[str]) -> Iterator[str]:
+    started = time.perf_counter()
+    chunks = 0
+    try:
+        for chunk in stream:
+            if chunks == 0 and HOOKS.llm_first_token:
+                emit(HOOKS.llm_first_token, time.perf_counter() - started)
+            chunks += 1
+            yield chunk
+    finally:
+        if HOOKS.llm_last_token:
+            emit(HOOKS.llm_last_token, time.perf_counter() - started, chunks)
+
+
+async def _instrument_astream(stream: AsyncIterator[str]) -> AsyncIterator[str]:
+    started = time.perf_counter()
+    chunks = 0
+    try:
+        async for chunk in stream:
+            if chunks == 0 and HOOKS.llm_first_token:
+                emit(HOOKS.llm_first_token, time.perf_counter() - started)
+            chunks += 1
+            yield chunk
+    finally:
+        if HOOKS.llm_last_token:
+            emit(HOOKS.llm_last_token, time.perf_counter() - started, chunks)
+
 
 def _mock_response(messages: List[Message]) -> str:
     last_user = _latest_user_message(messages)
@@ -110,6 +204,11 @@ EVENT_TYPE_LABELS = {
     "EventType.PRICE_DROP": "가격 급락",
     "EventType.PRICE_RISE": "가격 급등",
     "EventType.VOLUME_SPIKE": "거래량 급증",
+    "EventType.VWAP_DEVIATION": "VWAP 이탈",
+    "EventType.SPREAD_BLOWOUT": "스프레드 확대",
+    "EventType.BOOK_IMBALANCE": "호가 불균형",
+    "EventType.BID_DEPTH_DROP": "매수 호가 잔량 급감",
+    "EventType.MARKET_WIDE_MOVE": "시장 전체 동조 움직임",
 }
 
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Iterator
+from typing import AsyncIterator, Iterator, List, Optional
 
 from agent.context import ConversationContext
 from agent.llm_client import LLMClient, Message
@@ -31,3 +31,30 @@ class QaAgent:
             self._context.add(
                 Message(role="assistant", content=full_answer, timestamp=datetime.utcnow())
             )
+
+    async def answer_async(self, question: str) -> str:
+        chunks = []
+        async for chunk in self.astream_answer(question):
+            chunks.append(chunk)
+        return "".join(chunks).strip()
+
+    async def astream_answer(
+        self, question: str, *, history: Optional[List[Message]] = None
+    ) -> AsyncIterator[str]:
+        """stream_answer()의 asyncio 버전. 여러 질문을 한 이벤트 루프에서 동시에 처리한다.
+
+        history를 넘기면 공유 컨텍스트 대신 그 대화만 프롬프트에 쓰고, 답변도 공유
+        컨텍스트에 남기지 않는다(요청마다 독립적인 HTTP 클라이언트용).
+        """
+        user_prompt = Message(role="user", content=question, timestamp=datetime.utcnow())
+        shared = history is None
+        messages = (self._context.history() if shared else list(history)) + [user_prompt]
+        buffer: list[str] = []
+        async for chunk in self._llm.astream_complete(messages):
+            buffer.append(chunk)
+            yield chunk
+        full_answer = "".join(buffer).strip()
+        if full_answer and shared:
+            self._context.add(
+                Message(role="assistant", content=full_answer, timestamp=datetime.utcnow())
+            )
@@ -0,0 +1,97 @@
+"""CLI 콜드 스타트 비용을 `python -X importtime`으로 측정한다.
+
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --backend binance_ws --runs 10 --top 15
+
+각 시나리오를 새 인터프리터에서 반복 실행해 벽시계 시간(중앙값)과 import 시간
+합계를 출력하고, 마지막 실행에서 누적 import 시간이 큰 모듈을 보여준다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from config import settings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def scenarios(backend: str) -> Dict[str, str]:
+    return {
+        "interpreter": "pass",
+        "main --help": "import main",
+        "run_once setup": (
+            "import main\n"
+            "from config import settings\n"
+            f"settings.MARKET_DATA_BACKEND = {backend!r}\n"
+            "settings.CHECKPOINT_ENABLED = False\n"
+            "main.build_orchestrator()\n"
+        ),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="CLI cold-start import benchmark.")
+    parser.add_argument("--backend", default=settings.MARKET_DATA_BACKEND, help="시장 데이터 백엔드")
+    parser.add_argument("--runs", type=int, default=5, help="시나리오별 반복 횟수")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 모듈 수")
+    return parser.parse_args()
+
+
+def run_once(code: str) -> Tuple[float, List[Tuple[int, int, str]]]:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return elapsed, _parse_importtime(result.stderr)
+
+
+def _parse_importtime(output: str) -> List[Tuple[int, int, str]]:
+    rows: List[Tuple[int, int, str]] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        rows.append((int(parts[0]), int(parts[1]), parts[2].rstrip()))
+    return rows
+
+
+def main() -> None:
+    args = parse_args()
+    for name, code in scenarios(args.backend).items():
+        walls: List[float] = []
+        rows: List[Tuple[int, int, str]] = []
+        try:
+            for _ in range(args.runs):
+                wall, rows = run_once(code)
+                walls.append(wall)
+        except RuntimeError as exc:
+            print(f"{name}: failed ({exc})")
+            continue
+        total_ms = sum(self_us for self_us, _, _ in rows) / 1000
+        print(
+            f"{name}: wall={statistics.median(walls) * 1000:.1f}ms "
+            f"imports={len(rows)} import_time={total_ms:.1f}ms"
+        )
+        top_level = [row for row in rows if not row[2].startswith("  ")]
+        for _, cumulative_us, module in sorted(top_level, reverse=True, key=lambda row: row[1])[
+            : args.top
+        ]:
+            print(f"    {cumulative_us / 1000:8.1f}ms  {module.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""합성 시장 데이터로 MarketWatcherAgent 이벤트 경로 처리량을 측정한다.
+
+    python -m benchmarks.watcher_throughput --symbols 2000 --seconds 10
+    python -m benchmarks.watcher_throughput --rate 50000 --regime crash --regime-every 20
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from datetime import timedelta
+
+from config import settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Synthetic watcher throughput benchmark.")
+    parser.add_argument("--symbols", type=int, default=1000, help="합성 심볼 수")
+    parser.add_argument("--seconds", type=float, default=10.0, help="측정 시간(초)")
+    parser.add_argument("--rate", type=float, default=0.0, help="초당 목표 틱 수 (0 = 무제한)")
+    parser.add_argument("--seed", type=int, default=settings.SYNTHETIC_SEED)
+    parser.add_argument(
+        "--regime", choices=["crash", "spike"], default=None, help="주기적으로 주입할 국면"
+    )
+    parser.add_argument("--regime-every", type=int, default=50, help="국면 주입 간격(배치)")
+    parser.add_argument("--regime-length", type=int, default=5, help="국면 지속 배치 수")
+    return parser.parse_args()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args()
+    settings.MARKET_DATA_BACKEND = "synthetic"
+    settings.SYNTHETIC_SEED = args.seed
+    settings.SYNTHETIC_TARGET_RATE = args.rate
+    settings.CHECKPOINT_ENABLED = False
+    settings.MARKET_WINDOW = timedelta(seconds=5)
+
+    from watcher.agent import MarketWatcherAgent
+    from watcher.synthetic import synthetic_symbols
+
+    symbols = synthetic_symbols(args.symbols)
+    watcher = MarketWatcherAgent(symbols)
+    client = watcher._client
+
+    ticks = 0
+    events = 0
+    started = time.perf_counter()
+    deadline = started + args.seconds
+    for snapshot in client.stream_ticker(symbols):
+        events += len(watcher._process(snapshot))
+        ticks += 1
+        if ticks % args.symbols == 0:
+            batch = ticks // args.symbols
+            if args.regime and batch % args.regime_every == 0:
+                client.inject_regime(args.regime, batches=args.regime_length)
+            if time.perf_counter() >= deadline:
+                break
+
+    elapsed = time.perf_counter() - started
+    print(f"symbols={args.symbols} ticks={ticks} events={events} elapsed={elapsed:.2f}s")
+    print(f"throughput={ticks / elapsed:,.0f} ticks/s  events={events / elapsed:,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
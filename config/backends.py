@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import importlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Factory = Callable[[], Any]
+
+
+class BackendRegistry:
+    """백엔드 이름을 "module:factory" 경로로 등록해 두고 선택된 것만 import한다.
+
+    선택되지 않은 백엔드의 의존성(websocket-client, openai, numpy 등)은 로드되지
+    않으며, 생성에 실패하면 등록 시 지정한 fallback 백엔드로 넘어간다.
+    """
+
+    def __init__(self, kind: str, *, default: Optional[str] = None) -> None:
+        self._kind = kind
+        self._default = default
+        self._entries: Dict[str, Tuple[Union[str, Factory], Optional[str]]] = {}
+
+    def register(
+        self,
+        name: str,
+        factory: Union[str, Factory],
+        *,
+        fallback: Optional[str] = None,
+    ) -> None:
+        """factory는 인자 없는 호출 가능 객체 또는 "package.module:function" 문자열."""
+        self._entries[name.lower()] = (factory, fallback)
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self._entries
+
+    def load(self, name: str) -> Factory:
+        factory, _ = self._entries[name.lower()]
+        if isinstance(factory, str):
+            module_name, _, attr = factory.partition(":")
+            factory = getattr(importlib.import_module(module_name), attr)
+        return factory
+
+    def create(self, name: str) -> Any:
+        name = name.lower()
+        if name not in self._entries:
+            if self._default is None:
+                raise ValueError(f"Unknown {self._kind} backend: {name}")
+            logger.info("Unknown %s backend %r; using %s.", self._kind, name, self._default)
+            name = self._default
+
+        tried = set()
+        while True:
+            tried.add(name)
+            _, fallback = self._entries[name]
+            try:
+                return self.load(name)()
+            except Exception as exc:
+                if fallback is None or fallback in tried:
+                    raise
+                logger.warning("Falling back to %s %s backend: %s", fallback, self._kind, exc)
+                name = fallback
+
+
+MARKET_DATA_BACKENDS = BackendRegistry("market data", default="mock")
+MARKET_DATA_BACKENDS.register("mock", "watcher.clients:create_mock_client")
+MARKET_DATA_BACKENDS.register("binance_rest", "watcher.clients:create_rest_client")
+MARKET_DATA_BACKENDS.register(
+    "binance_ws", "watcher.clients:create_websocket_client", fallback="binance_rest"
+)
+MARKET_DATA_BACKENDS.register(
+    "binance_trades", "watcher.clients:create_trade_stream_client", fallback="binance_rest"
+)
+MARKET_DATA_BACKENDS.register(
+    "binance_depth", "watcher.clients:create_depth_client", fallback="binance_rest"
+)
+MARKET_DATA_BACKENDS.register(
+    "synthetic", "watcher.synthetic:create_synthetic_client", fallback="mock"
+)
+MARKET_DATA_BACKENDS.register("composite", "watcher.composite:create_composite_client")
+
+LLM_BACKENDS = BackendRegistry("LLM")
+LLM_BACKENDS.register("openai", "agent.llm_client:OpenAIBackend")
@@ -4,7 +4,12 @@ from datetime import timedelta
 # Symbols to monitor. Multiple pairs are supported.
 SYMBOLS = ["BTCUSDT"]
 
-# Market data backends: "binance_ws", "binance_rest", or "mock".
+# Market data backends: "binance_ws", "binance_trades", "binance_rest", or "mock".
+# "binance_trades" builds OHLCV bars from @aggTrade and evaluates on bar close.
+# "binance_depth" adds a local order book (@depth diffs) to ticker snapshots.
+# "composite" merges every backend in COMPOSITE_SOURCES in timestamp order.
+# "synthetic" generates seeded, correlated NumPy random walks for load testing.
+# Backends are looked up in config/backends.py and imported only when selected.
 MARKET_DATA_BACKEND = "binance_ws"
 
 # Binance endpoints and timing controls.
@@ -12,16 +17,96 @@ BINANCE_REST_BASE_URL = "https://api.binance.com"
 BINANCE_STREAM_BASE_URL = "wss://stream.binance.com:9443/stream"
 POLL_INTERVAL = timedelta(seconds=2)  # used by REST + mock fallbacks
 STREAM_RECONNECT_DELAY = timedelta(seconds=5)
+GAP_BACKFILL_MAX_WORKERS = 8  # concurrent REST baseline fetches after a reconnect
+ASYNC_QUEUE_SIZE = 10000  # snapshots buffered when a threaded client feeds the asyncio runtime
+
+# Synthetic load-test backend.
+SYNTHETIC_SEED = 7
+SYNTHETIC_TARGET_RATE = 1000.0  # ticks per second across all symbols; 0 = unthrottled
+SYNTHETIC_CORRELATION = 0.6  # loading on the common market factor in the calm regime
+SYNTHETIC_IDLE_INTERVAL = 0.05  # seconds to sleep per batch while no symbols are subscribed
+
+# Composite fan-in (composite backend).
+COMPOSITE_SOURCES = ["binance_ws", "binance_rest"]
+COMPOSITE_REORDER_WINDOW = timedelta(milliseconds=500)
+COMPOSITE_DEDUPE_SIZE = 4096  # recent (symbol, price, volume) keys remembered for dedupe
+
+# Local order book (binance_depth backend).
+BINANCE_DEPTH_SNAPSHOT_LIMIT = 1000
+ORDER_BOOK_DEPTH_LEVELS = 10  # top-N levels used for depth/imbalance
+ORDER_BOOK_MAX_PENDING = 1000  # buffered diff events while resyncing
+ORDER_BOOK_RESYNC_INTERVAL = 1.0  # seconds between snapshot requests per symbol
+
+# Trade-stream bar aggregation (binance_trades backend).
+TRADE_BAR_INTERVALS = ("1s", "1m", "5m")
+TRADE_BAR_EVALUATION_INTERVAL = "1m"
+TRADE_BAR_BUFFER_SIZE = 500  # closed bars kept per symbol and interval
+TRADE_BAR_CLOSE_GRACE = timedelta(milliseconds=500)
 
 # Trigger thresholds.
 MAX_PERCENT_DROP = 0.01
 MAX_PERCENT_RISE = 0.01
 VOLUME_SPIKE_MULTIPLIER = 1.3
+VWAP_DEVIATION_SIGMA = 3.0
+MAX_SPREAD_BPS = 10.0
+BOOK_IMBALANCE_THRESHOLD = 0.6
+BID_DEPTH_DROP_PERCENT = 50.0  # top-N bid depth lost since the previous tick (%)
+
+# Cross-sectional (market-wide) detection across all watched symbols.
+MARKET_REFERENCE_SYMBOL = "BTCUSDT"
+MARKET_WINDOW = timedelta(minutes=5)
+MARKET_MOVE_PERCENT = 0.5  # a symbol counts as down/up beyond this window return (%)
+MARKET_BREADTH_THRESHOLD = 0.7  # share of symbols that must move together
+MARKET_MIN_SYMBOLS = 3
+MARKET_BETA_SPAN = 100
+MARKET_SUPPRESS_SYMBOL_EVENTS = True  # drop same-direction per-symbol price events
+
+# Condition mode: "fixed" uses the thresholds above, "adaptive" fires when a tick
+# exceeds per-symbol streaming percentiles of Δ% and volume ratio.
+CONDITION_MODE = "fixed"
+ADAPTIVE_DROP_PERCENTILE = 0.01
+ADAPTIVE_RISE_PERCENTILE = 0.99
+ADAPTIVE_VOLUME_PERCENTILE = 0.99
+ADAPTIVE_MIN_SAMPLES = 50
+
+# Incremental indicator windows (in ticks) exposed to conditions via FeatureView.
+INDICATOR_EMA_SPAN = 20
+INDICATOR_VWAP_SPAN = 100
+INDICATOR_VOLUME_SPAN = 50
+INDICATOR_VOLATILITY_SPAN = 50
+INDICATOR_RSI_PERIOD = 14
+INDICATOR_WARMUP_TICKS = 20
+
+# Warm-restart checkpoint of per-symbol watcher state (last snapshot, indicators,
+# cross-sectional windows). Written off the watch loop by a background thread.
+CHECKPOINT_ENABLED = True
+CHECKPOINT_PATH = ".watcher_checkpoint.bin"
+CHECKPOINT_INTERVAL = timedelta(seconds=30)
+CHECKPOINT_MAX_AGE = timedelta(minutes=10)  # older checkpoints are ignored on startup
+CHECKPOINT_RESUME_MAX_GAP = timedelta(seconds=10)  # older restored ticks are treated as a stream gap
+
+# Q&A prompt context: at most this many events relevant to the question.
+QA_HISTORY_BUDGET = 5
+EVENT_INDEX_BUCKET = timedelta(minutes=5)
+
+# Headless HTTP/SSE server (main.py --serve).
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8080
+SSE_BUFFER_SIZE = 1000  # recent events kept for Last-Event-ID resume
+SSE_HEARTBEAT = timedelta(seconds=15)
+
+# Sampling profiler (--profile or SIGUSR1)
+PROFILE_OUTPUT_DIR = "profiles"
+PROFILE_DURATION = timedelta(seconds=30)
+PROFILE_SAMPLE_INTERVAL = timedelta(milliseconds=5)
+PROFILE_MAX_DURATION = timedelta(minutes=5)  # upper bound for a single capture
+PROFILE_TOP_FUNCTIONS = 30
 
 # Context TTL for reusing LLM outputs.
 SUMMARY_CACHE_TTL = timedelta(minutes=5)
 
-# LLM provider configuration (default: OpenAI).
+# LLM provider configuration (default: OpenAI). Providers are registered in
+# config/backends.py; unknown or unavailable providers fall back to the mock.
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
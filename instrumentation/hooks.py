@@ -0,0 +1,68 @@
+"""파이프라인 단계별 훅 레지스트리.
+
+단계와 콜백 시그니처:
+
+- snapshot_received(snapshot)                              워처가 클라이언트에서 스냅샷을 받음
+- condition_evaluated(condition, snapshot, event, elapsed)  조건 하나 평가 (event는 None 가능)
+- summary_built(event, summary, elapsed)                    이벤트 요약 생성
+- llm_first_token(elapsed)                                  LLM 스트림 첫 토큰
+- llm_last_token(elapsed, chunk_count)                      LLM 스트림 종료
+
+각 단계 속성은 콜백 튜플이며 등록된 훅이 없으면 빈 튜플이다. 호출 측은
+`if HOOKS.stage:`로 감싸므로 훅이 없을 때는 속성 조회 한 번만 든다.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_RECEIVED = "snapshot_received"
+CONDITION_EVALUATED = "condition_evaluated"
+SUMMARY_BUILT = "summary_built"
+LLM_FIRST_TOKEN = "llm_first_token"
+LLM_LAST_TOKEN = "llm_last_token"
+
+STAGES = (
+    SNAPSHOT_RECEIVED,
+    CONDITION_EVALUATED,
+    SUMMARY_BUILT,
+    LLM_FIRST_TOKEN,
+    LLM_LAST_TOKEN,
+)
+
+Hook = Callable[..., Any]
+
+
+class HookRegistry:
+    __slots__ = STAGES
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def register(self, stage: str, hook: Hook) -> Callable[[], None]:
+        """훅을 등록하고, 호출하면 등록을 해제하는 함수를 반환한다."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown hook stage: {stage}")
+        setattr(self, stage, getattr(self, stage) + (hook,))
+        return lambda: self.unregister(stage, hook)
+
+    def unregister(self, stage: str, hook: Hook) -> None:
+        setattr(self, stage, tuple(h for h in getattr(self, stage) if h is not hook))
+
+    def clear(self) -> None:
+        for stage in STAGES:
+            setattr(self, stage, ())
+
+
+HOOKS = HookRegistry()
+
+
+def emit(hooks: Tuple[Hook, ...], *args: Any) -> None:
+    """훅 예외가 파이프라인을 멈추지 않도록 개별적으로 격리해 호출한다."""
+    for hook in hooks:
+        try:
+            hook(*args)
+        except Exception:
+            logger.exception("Hook %r failed", hook)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_FrameKey = Tuple[str, str, int]
+
+
+class SamplingProfiler:
+    """정해진 시간 동안 모든 스레드의 스택을 주기적으로 샘플링해 리포트를 남긴다.
+
+    코드 수정 없이 운영 중에 켤 수 있도록 별도 데몬 스레드에서
+    `sys._current_frames()`만 읽으며, 한 번에 하나의 캡처만 실행한다.
+    결과는 flamegraph용 collapsed stack(`.folded`)과 상위 함수 요약(`.txt`)이다.
+    """
+
+    def __init__(
+        self,
+        *,
+        output_dir: str | None = None,
+        interval_seconds: float | None = None,
+        max_duration_seconds: float | None = None,
+    ) -> None:
+        self._output_dir = output_dir or settings.PROFILE_OUTPUT_DIR
+        self._interval = interval_seconds or settings.PROFILE_SAMPLE_INTERVAL.total_seconds()
+        self._max_duration = max_duration_seconds or settings.PROFILE_MAX_DURATION.total_seconds()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def capture(
+        self,
+        duration_seconds: float,
+        *,
+        on_complete: Callable[[str], None] | None = None,
+    ) -> bool:
+        """백그라운드 캡처를 시작한다. 이미 실행 중이면 False를 반환한다."""
+        with self._lock:
+            if self.is_running():
+                logger.info("프로파일 캡처가 이미 진행 중입니다.")
+                return False
+            duration = min(duration_seconds, self._max_duration)
+            self._worker = threading.Thread(
+                target=self._run,
+                args=(duration, on_complete),
+                name="sampling-profiler",
+                daemon=True,
+            )
+            self._worker.start()
+        logger.info("프로파일 캡처 시작: %.1fs", duration)
+        return True
+
+    def _run(self, duration: float, on_complete: Callable[[str], None] | None) -> None:
+        own_id = threading.get_ident()
+        stacks: Counter[Tuple[_FrameKey, ...]] = Counter()
+        samples = 0
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack: List[_FrameKey] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_name, frame.f_lineno))
+                    frame = frame.f_back
+                stacks[tuple(reversed(stack))] += 1
+            samples += 1
+            time.sleep(self._interval)
+
+        path = self._write_reports(stacks, samples, duration)
+        logger.info("프로파일 리포트 저장: %s", path)
+        if on_complete:
+            on_complete(path)
+
+    def _write_reports(
+        self, stacks: Counter, samples: int, duration: float
+    ) -> str:
+        os.makedirs(self._output_dir, exist_ok=True)
+        base = os.path.join(self._output_dir, datetime.now().strftime("profile-%Y%m%d-%H%M%S"))
+
+        with open(f"{base}.folded", "w", encoding="utf-8") as handle:
+            for stack, count in stacks.most_common():
+                names = ";".join(f"{name} ({_short(path)}:{line})" for path, name, line in stack)
+                handle.write(f"{names} {count}\n")
+
+        own: Counter[Tuple[str, str]] = Counter()
+        inclusive: Counter[Tuple[str, str]] = Counter()
+        total = sum(stacks.values()) or 1
+        for stack, count in stacks.items():
+            if stack:
+                path, name, _ = stack[-1]
+                own[(path, name)] += count
+            for key in {(path, name) for path, name, _ in stack}:
+                inclusive[key] += count
+
+        with open(f"{base}.txt", "w", encoding="utf-8") as handle:
+            handle.write(
+                f"samples={samples} thread_samples={total} duration={duration:.1f}s "
+                f"interval={self._interval * 1000:.1f}ms\n\n"
+            )
+            handle.write("self%   incl%   function\n")
+            for (path, name), count in own.most_common(settings.PROFILE_TOP_FUNCTIONS):
+                handle.write(
+                    f"{count / total * 100:6.2f}  {inclusive[(path, name)] / total * 100:6.2f}"
+                    f"   {name} ({_short(path)})\n"
+                )
+        return base
+
+
+def _short(path: str) -> str:
+    cwd = os.getcwd()
+    return os.path.relpath(path, cwd) if path.startswith(cwd) else os.path.basename(path)
+
+
+def install_signal_trigger(
+    profiler: SamplingProfiler,
+    *,
+    duration_seconds: float | None = None,
+) -> bool:
+    """SIGUSR1을 받으면 캡처를 시작하도록 핸들러를 설치한다. 지원되지 않으면 False."""
+    signum = getattr(signal, "SIGUSR1", None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+    duration = duration_seconds or settings.PROFILE_DURATION.total_seconds()
+    signal.signal(signum, lambda *_: profiler.capture(duration))
+    return True
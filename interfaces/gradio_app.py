@@ -138,7 +138,10 @@ def launch_gradio(orchestrator: Orchestrator) -> None:
             queue=False,
         )
 
-        gr.Markdown("토큰 소모를 줄이기 위해 최근 5개의 이벤트 히스토리만 참조합니다. 질문은 아래에 입력하세요.")
+        gr.Markdown(
+            f"토큰 소모를 줄이기 위해 질문과 관련된 이벤트 최대 {settings.QA_HISTORY_BUDGET}개만 참조합니다. "
+            "질문은 아래에 입력하세요."
+        )
         chat_history = gr.Chatbot(label="대화 로그", height=300)
         prompt_box = gr.Textbox(label="질문 입력", placeholder="예) 이게 단기 조정인가요?")
         ask_button = gr.Button("질문 보내기")
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from config import settings
+from orchestrator.workflow import Orchestrator
+from watcher.models import Event
+
+logger = logging.getLogger(__name__)
+
+_MAX_HEADER_BYTES = 16 * 1024
+_MAX_BODY_BYTES = 64 * 1024
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+class EventBroadcaster:
+    """이벤트를 SSE 프레임으로 한 번만 인코딩해 모든 구독자에게 나눠준다.
+
+    최근 프레임은 링 버퍼에 남겨 `Last-Event-ID`/`?since=`로 재개할 수 있고,
+    구독자들은 하나의 공유 future를 기다리므로 이벤트당 깨우기 비용이 일정하다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, *, capacity: int) -> None:
+        self._loop = loop
+        self._frames: Deque[Tuple[int, bytes]] = deque(maxlen=capacity)
+        self._waiter: asyncio.Future = loop.create_future()
+        self.subscribers = 0
+
+    def frames_after(self, seq: int) -> List[Tuple[int, bytes]]:
+        frames: List[Tuple[int, bytes]] = []
+        for frame_seq, frame in reversed(self._frames):
+            if frame_seq <= seq:
+                break
+            frames.append((frame_seq, frame))
+        frames.reverse()
+        return frames
+
+    def latest_seq(self) -> int:
+        return self._frames[-1][0] if self._frames else -1
+
+    def waiter(self) -> asyncio.Future:
+        """다음 publish 때 완료되는 future. 프레임을 읽기 전에 먼저 잡아야 깨우기를 놓치지 않는다."""
+        return self._waiter
+
+    def publish(self, seq: int, event: Event, summary: str) -> None:
+        """이벤트 루프 스레드에서 호출된다."""
+        payload = {
+            "seq": seq,
+            "symbol": event.symbol,
+            "event_type": event.event_type.value,
+            "summary": summary,
+            "price": event.snapshot.price,
+            "volume": event.snapshot.volume,
+            "metrics": event.change_metrics,
+            "triggered_at": event.triggered_at.isoformat(),
+        }
+        data = json.dumps(payload, ensure_ascii=False)
+        frame = f"id: {seq}\nevent: market_event\ndata: {data}\n\n".encode("utf-8")
+        self._frames.append((seq, frame))
+        waiter, self._waiter = self._waiter, self._loop.create_future()
+        waiter.set_result(None)
+
+
+class HttpServer:
+    """오케스트레이터를 헤드리스로 노출하는 경량 asyncio HTTP 서버.
+
+    - GET /events : 이벤트 SSE 스트림 (Last-Event-ID 또는 ?since=seq 로 재개)
+    - GET/POST /ask : Q&A 답변을 chunked 응답으로 스트리밍 (?q= 또는 {"question": ...}, 요청마다 독립된 대화)
+    - GET /health, GET /metrics : 상태/지표 JSON
+    """
+
+    def __init__(self, orchestrator: Orchestrator, *, host: str, port: int) -> None:
+        self._orchestrator = orchestrator
+        self._host = host
+        self._port = port
+        self._broadcaster: Optional[EventBroadcaster] = None
+
+    async def serve_forever(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._broadcaster = EventBroadcaster(loop, capacity=settings.SSE_BUFFER_SIZE)
+        # 감시 루프도 같은 이벤트 루프에서 돌므로 리스너는 루프 스레드에서 바로 호출된다.
+        self._orchestrator.add_listener(self._broadcaster.publish)
+        self._orchestrator.start_async()
+        server = await asyncio.start_server(self._handle, self._host, self._port)
+        logger.info("HTTP 서버 시작: http://%s:%d", self._host, self._port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self._orchestrator.stop_async()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await _read_request(reader)
+            if request is None:
+                return
+            method, target, headers, body = request
+            url = urlsplit(target)
+            query = parse_qs(url.query)
+            if url.path == "/events" and method == "GET":
+                await self._stream_events(reader, writer, headers, query)
+            elif url.path == "/ask" and method in ("GET", "POST"):
+                await self._stream_answer(writer, query, body)
+            elif url.path == "/health" and method == "GET":
+                await _write_json(writer, 200, self._health())
+            elif url.path == "/metrics" and method == "GET":
+                await _write_json(writer, 200, self._orchestrator.metrics())
+            elif url.path in ("/events", "/ask", "/health", "/metrics"):
+                await _write_json(writer, 405, {"error": "method not allowed"})
+            else:
+                await _write_json(writer, 404, {"error": "not found"})
+        except _RequestError as exc:
+            await _write_json(writer, exc.status, {"error": str(exc)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _health(self) -> Dict[str, object]:
+        broadcaster = self._broadcaster
+        return {
+            "running": self._orchestrator.is_running(),
+            "latest_seq": broadcaster.latest_seq() if broadcaster else -1,
+            "subscribers": broadcaster.subscribers if broadcaster else 0,
+        }
+
+    async def _stream_events(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        headers: Dict[str, str],
+        query: Dict[str, List[str]],
+    ) -> None:
+        broadcaster = self._broadcaster
+        assert broadcaster is not None
+        resume = headers.get("last-event-id") or (query.get("since") or [None])[0]
+        try:
+            cursor = int(resume) if resume is not None else broadcaster.latest_seq()
+        except ValueError:
+            raise _RequestError(400, "invalid resume sequence")
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream; charset=utf-8\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+        )
+        heartbeat = settings.SSE_HEARTBEAT.total_seconds()
+        # SSE 클라이언트는 요청 이후 보내는 것이 없으므로 읽기가 끝나면 연결이 닫힌 것이다.
+        disconnected = asyncio.ensure_future(reader.read(1))
+        broadcaster.subscribers += 1
+        try:
+            while not disconnected.done():
+                waiter = broadcaster.waiter()
+                frames = broadcaster.frames_after(cursor)
+                if frames:
+                    writer.write(b"".join(frame for _, frame in frames))
+                    cursor = frames[-1][0]
+                else:
+                    writer.write(b": ping\n\n")
+                await writer.drain()
+                await asyncio.wait(
+                    (waiter, disconnected),
+                    timeout=heartbeat,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+        finally:
+            broadcaster.subscribers -= 1
+            disconnected.cancel()
+
+    async def _stream_answer(
+        self,
+        writer: asyncio.StreamWriter,
+        query: Dict[str, List[str]],
+        body: bytes,
+    ) -> None:
+        question = (query.get("q") or [""])[0]
+        if body:
+            try:
+                question = json.loads(body.decode("utf-8")).get("question", question)
+            except (ValueError, AttributeError):
+                raise _RequestError(400, "body must be JSON with a 'question' field")
+        question = (question or "").strip()
+        if not question:
+            raise _RequestError(400, "question is required")
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/plain; charset=utf-8\r\n"
+            b"Transfer-Encoding: chunked\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        # 클라이언트 간에 답변이 섞이거나 프롬프트가 계속 커지지 않도록 요청마다 빈 대화로 답한다.
+        async for chunk in self._orchestrator.answer_follow_up_astream(question, history=[]):
+            data = chunk.encode("utf-8")
+            if data:
+                writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+
+class _RequestError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise _RequestError(413, "request header too large")
+    except asyncio.IncompleteReadError:
+        return None
+    if len(head) > _MAX_HEADER_BYTES:
+        raise _RequestError(413, "request header too large")
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise _RequestError(400, "malformed request line")
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0") or 0)
+    except ValueError:
+        raise _RequestError(400, "invalid Content-Length")
+    if length < 0:
+        raise _RequestError(400, "invalid Content-Length")
+    if length > _MAX_BODY_BYTES:
+        raise _RequestError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+async def _write_json(writer: asyncio.StreamWriter, status: int, payload: object) -> None:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode("latin-1")
+        + body
+    )
+    await writer.drain()
+
+
+def serve(orchestrator: Orchestrator, *, host: str | None = None, port: int | None = None) -> None:
+    server = HttpServer(
+        orchestrator,
+        host=host or settings.SERVER_HOST,
+        port=port or settings.SERVER_PORT,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        logger.info("HTTP 서버를 종료합니다.")
@@ -2,37 +2,65 @@ from __future__ import annotations
 
 import argparse
 import logging
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from agent.context import ConversationContext
-from agent.llm_client import LLMClient
-from agent.qa_agent import QaAgent
 from config import settings
-from interfaces.cli import prompt_follow_up
-from orchestrator.workflow import Orchestrator
-from watcher.agent import MarketWatcherAgent
+from instrumentation.profiler import SamplingProfiler, install_signal_trigger
+
+if TYPE_CHECKING:
+    from orchestrator.workflow import Orchestrator
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Market signal agent demo.")
     parser.add_argument("--gradio", action="store_true", help="Gradio UI를 실행합니다.")
+    parser.add_argument(
+        "--serve", action="store_true", help="헤드리스 HTTP/SSE 서버를 실행합니다."
+    )
+    parser.add_argument("--host", default=None, help="--serve 바인딩 주소")
+    parser.add_argument("--port", type=int, default=None, help="--serve 포트")
+    parser.add_argument(
+        "--profile",
+        type=float,
+        nargs="?",
+        const=settings.PROFILE_DURATION.total_seconds(),
+        default=None,
+        metavar="SECONDS",
+        help="시작 직후 지정한 시간 동안 샘플링 프로파일을 캡처합니다. (SIGUSR1로도 트리거)",
+    )
     return parser.parse_args()
 
 
+def build_orchestrator() -> Orchestrator:
+    """인자 파싱 이후에 무거운 모듈을 import해 CLI 시작(--help 등)을 가볍게 유지한다."""
+    from agent.context import ConversationContext
+    from agent.llm_client import LLMClient
+    from agent.qa_agent import QaAgent
+    from orchestrator.workflow import Orchestrator
+    from watcher.agent import MarketWatcherAgent
+
+    watcher = MarketWatcherAgent(settings.SYMBOLS)
+    context = ConversationContext(ttl=settings.SUMMARY_CACHE_TTL)
+    qa_agent = QaAgent(LLMClient(), context)
+    return Orchestrator(watcher, qa_agent)
+
+
 def main() -> None:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
     args = parse_args()
-    watcher = MarketWatcherAgent(settings.SYMBOLS)
-    context = ConversationContext(ttl=settings.SUMMARY_CACHE_TTL)
-    llm = LLMClient()
-    qa_agent = QaAgent(llm, context)
-    orchestrator = Orchestrator(watcher, qa_agent)
+    profiler = SamplingProfiler()
+    install_signal_trigger(profiler)
+    if args.profile:
+        profiler.capture(args.profile)
+
+    orchestrator = build_orchestrator()
 
     if args.gradio:
         from interfaces.gradio_app import launch_gradio
@@ -40,6 +68,14 @@ def main() -> None:
         launch_gradio(orchestrator)
         return
 
+    if args.serve:
+        from interfaces.http_server import serve
+
+        serve(orchestrator, host=args.host, port=args.port)
+        return
+
+    from interfaces.cli import prompt_follow_up
+
     backend = settings.MARKET_DATA_BACKEND
     print(f"Watching markets via '{backend}' backend... Press Ctrl+C to stop.")
     try:
@@ -50,6 +86,8 @@ def main() -> None:
             prompt_follow_up(orchestrator)
     except KeyboardInterrupt:
         print("\nWatcher interrupted by user.")
+    finally:
+        orchestrator.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from config import settings
+from watcher.cross_section import MARKET_SYMBOL
+from watcher.models import Event, EventType
+
+EVENT_TYPE_KEYWORDS: Dict[EventType, Tuple[str, ...]] = {
+    EventType.PRICE_DROP: ("급락", "하락", "떨어", "폭락", "drop", "dump", "crash", "fall"),
+    EventType.PRICE_RISE: ("급등", "상승", "오르", "올랐", "폭등", "rise", "pump", "rally", "surge"),
+    EventType.VOLUME_SPIKE: ("거래량", "volume"),
+    EventType.VWAP_DEVIATION: ("vwap",),
+    EventType.SPREAD_BLOWOUT: ("스프레드", "spread"),
+    EventType.BOOK_IMBALANCE: ("호가", "불균형", "imbalance", "orderbook", "order book"),
+    EventType.BID_DEPTH_DROP: ("매수벽", "잔량", "bid wall", "depth"),
+    EventType.MARKET_WIDE_MOVE: ("시장 전체", "전체 시장", "시장 전반", "market-wide", "market wide"),
+}
+
+SYMBOL_ALIASES: Dict[str, str] = {
+    "비트코인": "BTC",
+    "비트": "BTC",
+    "이더리움": "ETH",
+    "이더": "ETH",
+    "솔라나": "SOL",
+    "리플": "XRP",
+    "도지": "DOGE",
+    "바이낸스코인": "BNB",
+}
+
+_QUOTE_ASSETS = ("USDT", "USDC", "BUSD", "FDUSD", "BTC", "ETH")
+_STABLE_QUOTES = ("USDT", "USDC", "BUSD", "FDUSD")
+_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+_WINDOW_PATTERN = re.compile(
+    r"(\d+)\s*(분|시간|일|min(?:ute)?s?|h(?:our|r)?s?|d(?:ay)?s?)(?![a-z])", re.IGNORECASE
+)
+_KST_OFFSET = timedelta(hours=9)  # "오늘"은 한국 시간 자정 기준
+
+
+@dataclass
+class QueryTerms:
+    assets: Set[str] = field(default_factory=set)  # 질문에 나온 기초 자산(이벤트 유무와 무관)
+    symbols: Set[str] = field(default_factory=set)  # 그중 색인에 이벤트가 있는 심볼
+    event_types: Set[EventType] = field(default_factory=set)
+    since: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        return (
+            not self.assets and not self.symbols and not self.event_types and self.since is None
+        )
+
+
+def base_asset(symbol: str) -> str:
+    symbol = symbol.upper()
+    for quote in _QUOTE_ASSETS:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[: -len(quote)]
+    return symbol
+
+
+class EventIndex:
+    """기록된 이벤트를 심볼·이벤트 타입·시간 버킷별 포스팅 리스트로 색인한다.
+
+    포스팅 리스트는 seq 오름차순으로만 추가되므로, 질문에 맞는 최신 이벤트는
+    각 리스트의 꼬리만 읽어 찾을 수 있다(히스토리 전체를 스캔하지 않는다).
+    """
+
+    def __init__(self, *, bucket_seconds: float) -> None:
+        self._bucket_seconds = bucket_seconds
+        self._entries: Dict[int, Tuple[Event, str]] = {}
+        self._order: List[int] = []
+        self._by_symbol: Dict[str, List[int]] = {}
+        self._by_type: Dict[EventType, List[int]] = {}
+        self._by_bucket: Dict[int, List[int]] = {}
+        self._symbols_by_base: Dict[str, Set[str]] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, event: Event, summary: str) -> int:
+        seq = self._next_seq
+        self._next_seq += 1
+        symbol = event.symbol.upper()
+        self._entries[seq] = (event, summary)
+        self._order.append(seq)
+        self._by_symbol.setdefault(symbol, []).append(seq)
+        self._by_type.setdefault(event.event_type, []).append(seq)
+        self._by_bucket.setdefault(self._bucket(event.triggered_at), []).append(seq)
+        self._symbols_by_base.setdefault(base_asset(symbol), set()).add(symbol)
+        return seq
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._order.clear()
+        self._by_symbol.clear()
+        self._by_type.clear()
+        self._by_bucket.clear()
+        self._symbols_by_base.clear()
+
+    def parse(self, question: str, *, now: Optional[datetime] = None) -> QueryTerms:
+        """질문에서 심볼·이벤트 타입·시간 범위 키워드를 뽑는다."""
+        terms = QueryTerms()
+        lowered = question.lower()
+
+        known = self._known_assets()
+        for token in _TOKEN_PATTERN.findall(question):
+            token = token.upper()
+            base = base_asset(token)
+            if token in self._by_symbol or base in known or token.endswith(_STABLE_QUOTES):
+                terms.assets.add(base)
+        for alias, base in SYMBOL_ALIASES.items():
+            if alias in question:
+                terms.assets.add(base)
+        for asset in terms.assets:
+            terms.symbols.update(self._symbols_by_base.get(asset, ()))
+
+        for event_type, keywords in EVENT_TYPE_KEYWORDS.items():
+            if any(keyword in lowered for keyword in keywords):
+                terms.event_types.add(event_type)
+
+        now = now or datetime.utcnow()
+        match = _WINDOW_PATTERN.search(question)
+        if match:
+            amount = int(match.group(1))
+            unit = match.group(2).lower()
+            if unit.startswith(("분", "min")):
+                terms.since = now - timedelta(minutes=amount)
+            elif unit.startswith(("시간", "h")):
+                terms.since = now - timedelta(hours=amount)
+            else:
+                terms.since = now - timedelta(days=amount)
+        elif "오늘" in question or "today" in lowered:
+            midnight = (now + _KST_OFFSET).replace(hour=0, minute=0, second=0, microsecond=0)
+            terms.since = midnight - _KST_OFFSET
+        return terms
+
+    def search(self, question: str, budget: int) -> Tuple[List[str], bool]:
+        """질문과 관련된 요약을 시간순으로 최대 budget개 반환한다.
+
+        두 번째 값은 키워드가 하나라도 매칭됐는지 여부이며, 매칭되지 않으면
+        최근 이벤트 budget개로 대체한다. 질문에 심볼이 있으면 그 심볼과 시장 전체
+        이벤트만 후보로 삼고, 해당 심볼 이벤트가 없어도 다른 심볼로 대체하지 않는다.
+        """
+        if budget <= 0 or not self._order:
+            return [], False
+        terms = self.parse(question)
+        if terms.is_empty():
+            return self._summaries(self._order[-budget:]), False
+
+        depth = budget * 4
+        candidates: Set[int] = set()
+        if terms.assets:
+            for symbol in terms.symbols:
+                candidates.update(self._by_symbol.get(symbol, [])[-depth:])
+            candidates.update(self._by_symbol.get(MARKET_SYMBOL, [])[-depth:])
+        else:
+            for event_type in terms.event_types:
+                candidates.update(self._by_type.get(event_type, [])[-depth:])
+        if terms.since is not None and not terms.assets and not terms.event_types:
+            for bucket in self._recent_buckets(terms.since):
+                candidates.update(self._by_bucket.get(bucket, [])[-depth:])
+
+        scored: List[Tuple[int, int]] = []
+        for seq in candidates:
+            event, _ = self._entries[seq]
+            if terms.since is not None and event.triggered_at < terms.since:
+                continue
+            score = 0
+            symbol = event.symbol.upper()
+            if symbol in terms.symbols:
+                score += 2
+            elif terms.assets and symbol == MARKET_SYMBOL:
+                score += 1
+            if event.event_type in terms.event_types:
+                score += 2
+            scored.append((score, seq))
+        if not scored:
+            return [], True
+
+        scored.sort(reverse=True)
+        selected = sorted(seq for _, seq in scored[:budget])
+        return self._summaries(selected), True
+
+    def _known_assets(self) -> Set[str]:
+        """이벤트가 없어도 질문에서 알아볼 기초 자산: 설정 심볼, 별칭, 색인된 심볼."""
+        known = {base_asset(symbol) for symbol in settings.SYMBOLS}
+        known.update(SYMBOL_ALIASES.values())
+        known.update(self._symbols_by_base)
+        return known
+
+    def _bucket(self, moment: datetime) -> int:
+        return int(moment.timestamp() // self._bucket_seconds)
+
+    def _recent_buckets(self, since: datetime) -> Iterable[int]:
+        first = self._bucket(since)
+        last = self._bucket(self._entries[self._order[-1]][0].triggered_at)
+        return range(last, first - 1, -1)
+
+    def _summaries(self, seqs: Iterable[int]) -> List[str]:
+        return [self._entries[seq][1] for seq in seqs]
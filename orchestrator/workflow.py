@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import logging
 import threading
+import time
 from datetime import timedelta
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, AsyncIterator, Callable, List, Optional, Tuple
 
+from agent.llm_client import Message
 from agent.qa_agent import QaAgent
+from config import settings
+from instrumentation.hooks import HOOKS, emit
+from orchestrator.retrieval import EventIndex
 from watcher.agent import MarketWatcherAgent
+from watcher.cross_section import MARKET_SYMBOL
 from watcher.models import Event
 
+if TYPE_CHECKING:
+    import asyncio
+
+
+logger = logging.getLogger(__name__)
+
+EventListener = Callable[[int, Event, str], None]
+
 
 class Orchestrator:
     """Watcher 이벤트를 로그로 변환하고 QaAgent와 UI/CLI를 중개한다."""
@@ -19,17 +34,17 @@ class Orchestrator:
         self._latest_summary: Optional[str] = None
         self._history: List[Tuple[Event, str]] = []
         self._history_lock = threading.Lock()
+        self._index = EventIndex(bucket_seconds=settings.EVENT_INDEX_BUCKET.total_seconds())
+        self._listeners: List[EventListener] = []
         self._watch_thread: Optional[threading.Thread] = None
         self._stop_signal: Optional[threading.Event] = None
+        self._watch_task: Optional[asyncio.Task] = None
+        self._async_stop: Optional[asyncio.Event] = None
 
     def run_once(self) -> Optional[str]:
         """단일 이벤트를 처리해 요약 문자열을 반환한다."""
         event = next(self._watcher.watch())
-        summary = self._build_event_summary(event)
-        self._latest_event = event
-        self._latest_summary = summary
-        self._record_history(event, summary)
-        return summary
+        return self._handle_event(event)
 
     def start(self) -> None:
         if self.is_running():
@@ -43,26 +58,73 @@ class Orchestrator:
     def stop(self) -> None:
         if self._stop_signal:
             self._stop_signal.set()
-        if self._watch_thread:
-            self._watch_thread.join(timeout=2)
+        thread = self._watch_thread
+        if thread:
+            thread.join(timeout=2)
         self._watch_thread = None
         self._stop_signal = None
+        if thread is not None and thread.is_alive():
+            # 감시 스레드가 아직 캐시를 바꾸는 중이라 일관된 상태를 저장할 수 없다.
+            logger.warning("감시 스레드가 제때 종료되지 않아 마지막 체크포인트 저장을 건너뜁니다.")
+            return
+        self._watcher.flush_checkpoint()
 
     def is_running(self) -> bool:
+        if self._watch_task is not None and not self._watch_task.done():
+            return True
         return self._watch_thread is not None and self._watch_thread.is_alive()
 
     def _watch_loop(self, stop_signal: threading.Event) -> None:
         for event in self._watcher.watch(stop_event=stop_signal):
-            summary = self._build_event_summary(event)
-            self._latest_event = event
-            self._latest_summary = summary
-            self._record_history(event, summary)
+            self._handle_event(event)
             if stop_signal.is_set():
                 break
 
+    async def run_async(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """수집·감지를 현재 이벤트 루프에서 실행한다. stop_event가 설정되면 끝난다."""
+        async for event in self._watcher.watch_async(stop_event=stop_event):
+            self._handle_event(event)
+
+    def start_async(self) -> asyncio.Task:
+        """start()의 asyncio 버전. 실행 중인 이벤트 루프 안에서 호출해야 한다."""
+        import asyncio
+
+        if self._watch_task is None or self._watch_task.done():
+            self._async_stop = asyncio.Event()
+            self._watch_task = asyncio.create_task(self.run_async(self._async_stop))
+        return self._watch_task
+
+    async def stop_async(self) -> None:
+        import asyncio
+
+        if self._async_stop:
+            self._async_stop.set()
+        if self._watch_task:
+            try:
+                await asyncio.wait_for(self._watch_task, timeout=2)
+            except asyncio.TimeoutError:
+                self._watch_task.cancel()
+        self._watch_task = None
+        self._async_stop = None
+        await self._watcher.flush_checkpoint_async()
+
+    def _handle_event(self, event: Event) -> str:
+        summary = self._build_event_summary(event)
+        self._latest_event = event
+        self._latest_summary = summary
+        self._record_history(event, summary)
+        return summary
+
+    def add_listener(self, listener: EventListener) -> None:
+        """이벤트가 기록될 때마다 (seq, event, summary)로 호출할 콜백을 등록한다."""
+        self._listeners.append(listener)
+
     def _record_history(self, event: Event, summary: str) -> None:
         with self._history_lock:
             self._history.append((event, summary))
+            seq = self._index.add(event, summary)
+        for listener in self._listeners:
+            listener(seq, event, summary)
 
     def event_history(self) -> List[Tuple[Event, str]]:
         with self._history_lock:
@@ -71,6 +133,7 @@ class Orchestrator:
     def clear_history(self) -> None:
         with self._history_lock:
             self._history.clear()
+            self._index.clear()
         self._latest_event = None
         self._latest_summary = None
 
@@ -81,6 +144,9 @@ class Orchestrator:
     def latest_event(self) -> Optional[Event]:
         return self._latest_event
 
+    def metrics(self) -> dict[str, float]:
+        return self._watcher.metrics()
+
     def answer_follow_up(self, question: str) -> str:
         chunks = []
         for chunk in self.answer_follow_up_stream(question):
@@ -92,34 +158,84 @@ class Orchestrator:
         enriched_question = self._inject_history(question)
         yield from self._qa_agent.stream_answer(enriched_question)
 
+    async def answer_follow_up_async(self, question: str) -> str:
+        chunks = []
+        async for chunk in self.answer_follow_up_astream(question):
+            chunks.append(chunk)
+        return "".join(chunks).strip()
+
+    async def answer_follow_up_astream(
+        self, question: str, *, history: Optional[List[Message]] = None
+    ) -> AsyncIterator[str]:
+        """answer_follow_up_stream()의 asyncio 버전. history는 QaAgent.astream_answer()로 넘긴다."""
+        enriched_question = self._inject_history(question)
+        async for chunk in self._qa_agent.astream_answer(enriched_question, history=history):
+            yield chunk
+
     def _inject_history(self, question: str) -> str:
-        lines = self.history_lines()
+        """질문과 관련된 이벤트를 색인에서 찾아 예산(QA_HISTORY_BUDGET) 안에서 붙인다."""
+        with self._history_lock:
+            lines, matched = self._index.search(question, settings.QA_HISTORY_BUDGET)
         if not lines:
             return question
-        history_text = "최근 이벤트 목록:\n" + "\n".join(lines[-5:])
+        header = "관련 이벤트 목록:" if matched else "최근 이벤트 목록:"
+        history_text = header + "\n" + "\n".join(lines)
         return f"{history_text}\n\n사용자 질문: {question}"
 
     def summaries_text(self) -> str:
         return "\n".join(self.history_lines())
 
     def _build_event_summary(self, event: Event) -> str:
-        timestamp = (event.snapshot.timestamp + timedelta(hours=9)).strftime("%Y-%m-%d %H:%M:%S")
-        symbol = _format_symbol(event.symbol)
-        event_type = event.event_type.value
-        change_pct = event.change_metrics.get("price_change_pct")
-        volume_mult = event.change_metrics.get("volume_multiple")
-        if change_pct is not None:
-            direction = "상승" if change_pct > 0 else "하락" if change_pct < 0 else "변동 없음"
-            metric_desc = f"직전 대비 {abs(change_pct):.2f}% {direction}했습니다."
-        elif volume_mult is not None:
-            metric_desc = f"거래량이 직전 대비 {volume_mult:.2f}배 증가했습니다."
-        else:
-            metric_desc = "조건을 충족한 이벤트입니다."
-        return f"[{event_type}] [{timestamp}] [{symbol}] {metric_desc}"
+        hooks = HOOKS.summary_built
+        if not hooks:
+            return _format_event_summary(event)
+        started = time.perf_counter()
+        summary = _format_event_summary(event)
+        emit(hooks, event, summary, time.perf_counter() - started)
+        return summary
+
+
+def _format_event_summary(event: Event) -> str:
+    timestamp = (event.snapshot.timestamp + timedelta(hours=9)).strftime("%Y-%m-%d %H:%M:%S")
+    symbol = _format_symbol(event.symbol)
+    event_type = event.event_type.value
+    change_pct = event.change_metrics.get("price_change_pct")
+    volume_mult = event.change_metrics.get("volume_multiple")
+    vwap_zscore = event.change_metrics.get("vwap_zscore")
+    spread_bps = event.change_metrics.get("spread_bps")
+    imbalance = event.change_metrics.get("book_imbalance")
+    bid_depth_change = event.change_metrics.get("bid_depth_change_pct")
+    breadth = event.change_metrics.get("breadth")
+    if breadth is not None:
+        direction = "하락" if event.change_metrics.get("direction", 0) < 0 else "상승"
+        metric_desc = (
+            f"감시 심볼의 {breadth * 100:.0f}%가 함께 {direction}했습니다. "
+            f"(평균 {event.change_metrics.get('mean_return_pct', 0.0):+.2f}%)"
+        )
+    elif change_pct is not None:
+        direction = "상승" if change_pct > 0 else "하락" if change_pct < 0 else "변동 없음"
+        metric_desc = f"직전 대비 {abs(change_pct):.2f}% {direction}했습니다."
+    elif volume_mult is not None:
+        metric_desc = f"거래량이 직전 대비 {volume_mult:.2f}배 증가했습니다."
+    elif vwap_zscore is not None:
+        direction = "위" if vwap_zscore > 0 else "아래"
+        metric_desc = f"가격이 VWAP 대비 {abs(vwap_zscore):.2f}σ {direction}에 있습니다."
+    elif bid_depth_change is not None:
+        metric_desc = f"상위 매수 호가 잔량이 직전 대비 {abs(bid_depth_change):.0f}% 줄었습니다."
+    elif spread_bps is not None:
+        metric_desc = f"호가 스프레드가 {spread_bps:.1f}bp로 벌어졌습니다."
+    elif imbalance is not None:
+        side = "매수" if imbalance > 0 else "매도"
+        metric_desc = f"상위 호가 잔량이 {side} 쪽으로 {abs(imbalance) * 100:.0f}% 쏠렸습니다."
+    else:
+        metric_desc = "조건을 충족한 이벤트입니다."
+    return f"[{event_type}] [{timestamp}] [{symbol}] {metric_desc}"
 
 
 def _format_symbol(symbol: str) -> str:
     symbol = symbol.upper()
+    if symbol == MARKET_SYMBOL:
+        return "시장 전체"
     if len(symbol) > 4:
         base = symbol[:-4]
         quote = symbol[-4:]
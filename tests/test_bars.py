@@ -0,0 +1,31 @@
+from watcher.bars import BarAggregator, BarSeries
+
+MINUTE = 60_000
+
+
+def test_late_trade_after_flush_does_not_reopen_closed_bar():
+    series = BarSeries("BTCUSDT", "1m", capacity=8)
+    assert series.add_trade(100.0, 10.0, MINUTE + 1_000) is None
+
+    closed = series.flush(2 * MINUTE + 500)
+    assert closed is not None and closed.volume == 10.0
+
+    # 유예 시간을 넘겨 도착한 같은 분의 체결은 봉을 다시 열지 않는다.
+    assert series.add_trade(101.0, 0.1, MINUTE + 59_000) is None
+    assert series.late_trades == 1
+    assert series.flush(3 * MINUTE) is None
+
+    series.add_trade(102.0, 5.0, 2 * MINUTE + 10_000)
+    bar = series.flush(3 * MINUTE)
+    assert [b.start for b in series.recent(2)] == [bar.start, closed.start]
+    assert bar.volume == 5.0 and bar.start > closed.start
+
+
+def test_trade_crossing_boundary_closes_previous_bar():
+    aggregator = BarAggregator(["1m"], capacity=8)
+    aggregator.add_trade("BTCUSDT", 100.0, 1.0, 1_000)
+    closed = aggregator.add_trade("BTCUSDT", 101.0, 2.0, MINUTE + 1_000)
+    assert [(bar.open, bar.volume) for bar in closed] == [(100.0, 1.0)]
+
+    aggregator.add_trade("BTCUSDT", 99.0, 3.0, 30_000)
+    assert aggregator.late_trades() == 1
@@ -0,0 +1,114 @@
+from config import settings
+from watcher.clients import BinanceDepthClient
+from watcher.conditions import bid_depth_drop_condition, spread_blowout_condition
+from watcher.models import EventType
+
+
+def _depth(first, final, bids=(), asks=()):
+    return {
+        "stream": "btcusdt@depth@100ms",
+        "data": {"e": "depthUpdate", "s": "BTCUSDT", "U": first, "u": final, "b": bids, "a": asks},
+    }
+
+
+def _ticker(price):
+    return {"stream": "btcusdt@ticker", "data": {"e": "24hrTicker", "s": "BTCUSDT", "c": price, "v": "10"}}
+
+
+def _replay(payloads, snapshots):
+    pending = list(snapshots)
+    fetched = []
+
+    def fetch(symbol):
+        fetched.append(symbol)
+        return pending.pop(0) if pending else None
+
+    client = BinanceDepthClient(
+        stream_base_url="wss://replay.invalid/stream",
+        reconnect_delay_seconds=0.0,
+        rest_base_url="https://replay.invalid",
+        depth_levels=5,
+        snapshot_fetcher=fetch,
+        payload_source=payloads,
+    )
+    return client, list(client.stream_ticker(["BTCUSDT"])), fetched
+
+
+def test_replay_syncs_detects_gap_and_resyncs(monkeypatch):
+    monkeypatch.setattr(settings, "ORDER_BOOK_RESYNC_INTERVAL", 0.0)
+    payloads = [
+        _depth(95, 105, bids=[["100", "6"]]),  # 스냅샷(100) 이전부터 이어지는 첫 diff
+        _ticker("100.5"),
+        _depth(106, 110, bids=[["99", "0"]]),
+        _ticker("100.5"),
+        _depth(150, 160, asks=[["101", "2"]]),  # 111~149 누락 → 갭
+        _ticker("100.5"),
+        _depth(161, 170, bids=[["100", "3"]]),
+        _ticker("100.5"),
+    ]
+    snapshots = [
+        {"lastUpdateId": 100, "bids": [["100", "5"], ["99", "5"]], "asks": [["101", "5"], ["102", "5"]]},
+        {"lastUpdateId": 140, "bids": [["100", "1"]], "asks": [["101", "1"]]},  # 갭보다 오래된 스냅샷
+        {"lastUpdateId": 165, "bids": [["100", "2"]], "asks": [["101", "4"]]},
+    ]
+    client, ticks, fetched = _replay(payloads, snapshots)
+
+    assert len(ticks) == 4 and len(fetched) == 3
+    synced, removed, gapped, resynced = (tick.book for tick in ticks)
+    assert synced.best_bid == 100 and synced.bid_depth == 11  # 스냅샷 + 버퍼된 diff
+    assert removed.bid_depth == 6
+    assert gapped is None  # 오래된 스냅샷으로는 동기화하지 않는다
+    assert resynced.bid_depth == 3 and resynced.ask_depth == 4
+    assert client.book("BTCUSDT").last_update_id == 170
+
+
+def test_replayed_book_changes_drive_liquidity_conditions(monkeypatch):
+    monkeypatch.setattr(settings, "ORDER_BOOK_RESYNC_INTERVAL", 0.0)
+    payloads = [
+        _depth(101, 101),
+        _ticker("100.5"),
+        _ticker("100.5"),
+        _depth(102, 102, bids=[["100", "0"]], asks=[["100.05", "0"]]),  # 매수벽 철수 + 스프레드 확대
+        _ticker("100.5"),
+        _ticker("100.5"),
+    ]
+    snapshots = [
+        {"lastUpdateId": 100, "bids": [["100", "8"], ["90", "2"]], "asks": [["100.05", "5"], ["110", "5"]]},
+    ]
+    _, ticks, _ = _replay(payloads, snapshots)
+
+    events = [
+        [condition(current, previous) for condition in (bid_depth_drop_condition, spread_blowout_condition)]
+        for previous, current in zip(ticks, ticks[1:])
+    ]
+    assert events[0] == [None, None]  # 호가가 그대로면 매 틱 발생하지 않는다
+    drop, blowout = events[1]
+    assert drop.event_type == EventType.BID_DEPTH_DROP
+    assert drop.change_metrics["bid_depth_change_pct"] == -80.0
+    assert blowout.event_type == EventType.SPREAD_BLOWOUT
+    assert events[2] == [None, None]  # 넓어진 스프레드가 유지돼도 다시 발생하지 않는다
+
+
+def test_malformed_depth_messages_are_dropped_and_trigger_resync(monkeypatch):
+    monkeypatch.setattr(settings, "ORDER_BOOK_RESYNC_INTERVAL", 0.0)
+    payloads = [
+        _depth(101, 101),
+        _ticker("100.5"),
+        _depth(102, 102, bids=[["x", "1"]]),  # 잘못된 가격 → 버리고 동기화 해제
+        _ticker("100.5"),
+        _depth("bad", 103),
+        _depth(104, 104, bids=[["100", "7"]]),
+        _ticker("100.5"),
+    ]
+    snapshots = [
+        {"lastUpdateId": 100, "bids": [["100", "5"]], "asks": [["101", "5"]]},
+        {"lastUpdateId": 102, "bids": [["100", "6"]], "asks": [["101", "5"]]},
+        {"lastUpdateId": 103, "bids": [["100", "6"]], "asks": [["101", "5"]]},
+    ]
+    _, ticks, fetched = _replay(payloads, snapshots)
+
+    synced, dropped, resynced = (tick.book for tick in ticks)
+    assert synced.bid_depth == 5
+    assert dropped is None
+    assert resynced.bid_depth == 7
+    assert len(fetched) == 3
@@ -0,0 +1,47 @@
+import asyncio
+from datetime import timedelta
+
+from agent.context import ConversationContext
+from agent.llm_client import LLMClient
+from agent.qa_agent import QaAgent
+
+
+class RecordingLLM(LLMClient):
+    """프롬프트로 받은 메시지를 기록하고 고정 답변을 돌려주는 테스트용 클라이언트."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def astream_complete(self, messages):
+        self.prompts.append([message.content for message in messages])
+        yield f"answer {len(self.prompts)}"
+
+
+def _collect(stream):
+    async def run():
+        return [chunk async for chunk in stream]
+
+    return asyncio.run(run())
+
+
+def test_explicit_history_does_not_share_answers_between_requests():
+    llm = RecordingLLM()
+    context = ConversationContext(ttl=timedelta(minutes=5))
+    agent = QaAgent(llm, context)
+
+    assert _collect(agent.astream_answer("first?", history=[])) == ["answer 1"]
+    assert _collect(agent.astream_answer("second?", history=[])) == ["answer 2"]
+
+    assert llm.prompts == [["first?"], ["second?"]]
+    assert context.history() == []
+
+
+def test_shared_context_is_used_without_history():
+    llm = RecordingLLM()
+    context = ConversationContext(ttl=timedelta(minutes=5))
+    agent = QaAgent(llm, context)
+
+    _collect(agent.astream_answer("first?"))
+    _collect(agent.astream_answer("second?"))
+
+    assert llm.prompts[1] == ["answer 1", "second?"]
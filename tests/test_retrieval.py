@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from orchestrator.retrieval import EventIndex
+from watcher.cross_section import MARKET_SYMBOL
+from watcher.models import Event, EventType, MarketSnapshot
+
+NOW = datetime(2026, 10, 19, 20, 0)  # UTC (KST 10/20 05:00)
+
+
+def _index(*events):
+    index = EventIndex(bucket_seconds=60)
+    for minutes_ago, symbol, event_type in events:
+        at = NOW - timedelta(minutes=minutes_ago)
+        snapshot = MarketSnapshot(symbol=symbol, price=1.0, volume=1.0, timestamp=at)
+        event = Event(symbol, event_type, snapshot, {}, at)
+        index.add(event, f"{symbol} {event_type.value} -{minutes_ago}m")
+    return index
+
+
+def test_named_symbol_without_events_does_not_fall_back_to_other_symbols():
+    index = _index(*[(minute, "BTCUSDT", EventType.PRICE_DROP) for minute in range(4, -1, -1)])
+
+    assert index.parse("ETH 어때?").assets == {"ETH"}
+    assert index.search("ETH 어때?", budget=5) == ([], True)
+    assert index.search("이더리움 급락했어?", budget=5) == ([], True)
+    recent = ["BTCUSDT PRICE_DROP -1m", "BTCUSDT PRICE_DROP -0m"]
+    assert index.search("요즘 어때?", budget=2) == (recent, False)
+
+
+def test_named_symbol_keeps_market_wide_events():
+    index = _index(
+        (3, "BTCUSDT", EventType.PRICE_DROP),
+        (2, MARKET_SYMBOL, EventType.MARKET_WIDE_MOVE),
+        (1, "ETHUSDT", EventType.PRICE_RISE),
+    )
+
+    lines, matched = index.search("ETHUSDT 상승 이유?", budget=5)
+    assert matched
+    assert lines == ["MARKET MARKET_WIDE_MOVE -2m", "ETHUSDT PRICE_RISE -1m"]
+
+
+def test_parse_time_windows():
+    index = _index()
+
+    assert index.parse("3 hrs 동안", now=NOW).since == NOW - timedelta(hours=3)
+    assert index.parse("last 2 hr", now=NOW).since == NOW - timedelta(hours=2)
+    assert index.parse("30분 전부터", now=NOW).since == NOW - timedelta(minutes=30)
+    assert index.parse("ETH dropped 5 dollars?", now=NOW).since is None
+    # "오늘"은 한국 시간 자정(= 전날 15:00 UTC)부터
+    assert index.parse("오늘 이벤트", now=NOW).since == datetime(2026, 10, 19, 15, 0)
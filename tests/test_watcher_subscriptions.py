@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import watcher.agent
+from config import settings
+from watcher.agent import MarketWatcherAgent
+from watcher.models import EventType, MarketSnapshot
+
+
+class ScriptedClient:
+    """(심볼, 가격) 틱을 순서대로 내보내고, 호출 가능 항목은 그 시점에 실행하는 테스트용 클라이언트."""
+
+    def __init__(self):
+        self.script = []
+
+    def stream_ticker(self, symbols, stop_event=None):
+        for step in self.script:
+            if callable(step):
+                step()
+                continue
+            symbol, price = step
+            yield MarketSnapshot(symbol=symbol, price=price, volume=100.0, timestamp=datetime.utcnow())
+
+    def subscribe(self, symbols):
+        pass
+
+    def unsubscribe(self, symbols):
+        pass
+
+
+def _agent(monkeypatch):
+    client = ScriptedClient()
+    monkeypatch.setattr(settings, "CHECKPOINT_ENABLED", False)
+    monkeypatch.setattr(watcher.agent, "build_default_client", lambda: client)
+    return MarketWatcherAgent(["BTCUSDT", "AAAUSDT"]), client
+
+
+def _resubscribe(agent, symbol):
+    def step():
+        agent.unsubscribe([symbol])
+        agent.subscribe([symbol])
+
+    return step
+
+
+def test_resubscribed_symbol_starts_fresh(monkeypatch):
+    agent, client = _agent(monkeypatch)
+    client.script = [("AAAUSDT", 98.0), _resubscribe(agent, "AAAUSDT"), ("AAAUSDT", 150.0)]
+
+    assert list(agent.watch()) == []
+
+
+def test_watched_symbol_still_compares_with_previous_tick(monkeypatch):
+    agent, client = _agent(monkeypatch)
+    client.script = [("AAAUSDT", 98.0), ("AAAUSDT", 150.0)]
+
+    assert [event.event_type for event in agent.watch()][:1] == [EventType.PRICE_RISE]
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Iterator, List, Optional
-from threading import Event as ThreadEvent
+import time
+from array import array
+from collections import deque
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Iterable, Iterator, List, Optional
+from threading import Event as ThreadEvent, Lock
 
-from watcher.clients import build_default_client
-from watcher.conditions import DEFAULT_CONDITIONS, Condition
-from watcher.models import Event, MarketSnapshot
+from config import settings
+from instrumentation.hooks import HOOKS, emit
+from watcher.checkpoint import CheckpointWriter, load_checkpoint
+from watcher.clients import AsyncMarketDataClient, as_async_client, build_default_client
+from watcher.conditions import Condition, build_conditions
+from watcher.cross_section import CrossSectionalMonitor
+from watcher.indicators import IndicatorEngine
+from watcher.models import Event, EventType, MarketSnapshot
+
+if TYPE_CHECKING:
+    import asyncio
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)  # 스냅샷 시각은 naive UTC
+
 
 class MarketWatcherAgent:
     """거래소 스냅샷을 평가해 트리거 조건을 만족하면 Event를 생성한다."""
@@ -19,49 +33,274 @@ class MarketWatcherAgent:
         symbols: Iterable[str],
         conditions: Iterable[Condition] | None = None,
     ) -> None:
-        self._symbols = list(symbols)
+        self._symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        self._active_symbols = frozenset(self._symbols)
+        self._symbols_lock = Lock()
+        self._released: Deque[str] = deque()
+        self._gap_snapshots = 0
+        self._suppressed_events = 0
         self._client = build_default_client()
+        self._async_client: Optional[AsyncMarketDataClient] = None
+        self._restored: set[str] = set()
         self._cache: dict[str, MarketSnapshot] = {}
-        self._conditions = list(conditions) if conditions else list(DEFAULT_CONDITIONS)
+        self._indicators = IndicatorEngine()
+        self._cross_section = CrossSectionalMonitor()
+        self._checkpoint: Optional[CheckpointWriter] = None
+        if settings.CHECKPOINT_ENABLED:
+            self._restore_checkpoint()
+            self._checkpoint = CheckpointWriter(
+                settings.CHECKPOINT_PATH,
+                interval_seconds=settings.CHECKPOINT_INTERVAL.total_seconds(),
+            )
+        self._conditions = list(conditions) if conditions else build_conditions()
+
+    def metrics(self) -> dict[str, float]:
+        """스트림 갭 관련 지표(재연결·끊김 시간·생략 이벤트 수)를 반환한다."""
+        metrics: dict[str, float] = {
+            "gap_snapshots": self._gap_snapshots,
+            "suppressed_events": self._suppressed_events,
+        }
+        gap_metrics = getattr(self._client, "gap_metrics", None)
+        if gap_metrics is not None:
+            metrics.update(gap_metrics())
+        return metrics
+
+    def symbols(self) -> List[str]:
+        with self._symbols_lock:
+            return list(self._symbols)
+
+    def subscribe(self, symbols: Iterable[str]) -> List[str]:
+        """스트림을 끊지 않고 감시 심볼을 추가한다. 새로 추가된 심볼을 반환한다."""
+        with self._symbols_lock:
+            added = [
+                symbol
+                for symbol in dict.fromkeys(symbol.upper() for symbol in symbols)
+                if symbol not in self._active_symbols
+            ]
+            if not added:
+                return []
+            self._symbols.extend(added)
+            self._active_symbols = frozenset(self._symbols)
+        self._client.subscribe(added)
+        logger.info("심볼 구독 추가: %s", ", ".join(added))
+        return added
+
+    def unsubscribe(self, symbols: Iterable[str]) -> List[str]:
+        """감시 심볼을 제거한다. 심볼별 상태는 감시 루프에서 해제된다."""
+        with self._symbols_lock:
+            targets = {symbol.upper() for symbol in symbols}
+            removed = [symbol for symbol in self._symbols if symbol in targets]
+            if not removed:
+                return []
+            self._symbols = [symbol for symbol in self._symbols if symbol not in targets]
+            self._active_symbols = frozenset(self._symbols)
+            self._released.extend(removed)
+        self._client.unsubscribe(removed)
+        logger.info("심볼 구독 해제: %s", ", ".join(removed))
+        return removed
 
     def watch(self, stop_event: Optional[ThreadEvent] = None) -> Iterator[Event]:
         """클라이언트 스트림을 소비하면서 조건을 만족하는 이벤트를 순차적으로 반환한다."""
-        for snapshot in self._client.stream_ticker(self._symbols, stop_event=stop_event):
+        for snapshot in self._client.stream_ticker(self.symbols(), stop_event=stop_event):
             if stop_event and stop_event.is_set():
                 break
-            previous = self._cache.get(snapshot.symbol)
-            self._cache[snapshot.symbol] = snapshot
-            if previous is None:
-                logger.info(
-                    "첫 스냅샷 수신: %s price=%.2f volume=%.2f",
-                    snapshot.symbol,
-                    snapshot.price,
-                    snapshot.volume,
-                )
-                continue
+            for event in self._handle(snapshot):
+                yield event
+
+    async def watch_async(
+        self, stop_event: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[Event]:
+        """watch()의 asyncio 버전. 스트림 수신과 조건 평가를 이벤트 루프에서 처리한다."""
+        if self._async_client is None:
+            self._async_client = as_async_client(self._client)
+        stream = self._async_client.stream_ticker_async(self.symbols(), stop_event=stop_event)
+        try:
+            async for snapshot in stream:
+                if stop_event and stop_event.is_set():
+                    break
+                for event in self._handle(snapshot):
+                    yield event
+        finally:
+            await stream.aclose()  # type: ignore[attr-defined]
+
+    def _handle(self, snapshot: MarketSnapshot) -> List[Event]:
+        if self._released:
+            self._release_symbols()
+        if snapshot.symbol.upper() not in self._active_symbols:
+            return []
+        events = self._process(snapshot)
+        if self._checkpoint and self._checkpoint.due():
+            self._checkpoint.submit(self._checkpoint_state())
+        for event in events:
+            logger.info("이벤트 발생: %s (%s)", event.symbol, event.event_type.value)
+        return events
 
-            change_pct = snapshot.percent_change(previous)
-            volume_ratio = snapshot.volume_ratio(previous)
+    def _process(self, snapshot: MarketSnapshot) -> List[Event]:
+        """스냅샷 한 건으로 지표·캐시를 갱신하고 심볼/시장 전체 이벤트를 만든다."""
+        if HOOKS.snapshot_received:
+            emit(HOOKS.snapshot_received, snapshot)
+        snapshot.features = self._indicators.update(snapshot)
+        previous = self._cache.get(snapshot.symbol)
+        if self._restored and snapshot.symbol in self._restored:
+            self._restored.discard(snapshot.symbol)
+            if previous is not None and self._is_stale_restore(snapshot, previous):
+                snapshot.gap = True
+        self._cache[snapshot.symbol] = snapshot
+        market_event = self._cross_section.update(snapshot)
+        if previous is None:
             logger.info(
-                "틱 업데이트: %s price=%.2f volume=%.2f Δ%%=%.5f volume×=%.3f",
+                "첫 스냅샷 수신: %s price=%.2f volume=%.2f",
                 snapshot.symbol,
                 snapshot.price,
                 snapshot.volume,
-                change_pct,
-                volume_ratio,
             )
+            return [market_event] if market_event else []
 
-            for event in self._evaluate(snapshot, previous):
-                logger.info("이벤트 발생: %s (%s)", event.symbol, event.event_type.value)
-                yield event
+        change_pct = snapshot.percent_change(previous)
+        volume_ratio = snapshot.volume_ratio(previous)
+        logger.info(
+            "틱 업데이트: %s price=%.2f volume=%.2f Δ%%=%.5f volume×=%.3f",
+            snapshot.symbol,
+            snapshot.price,
+            snapshot.volume,
+            change_pct,
+            volume_ratio,
+        )
+
+        events = self._evaluate(snapshot, previous)
+        if snapshot.gap:
+            if market_event:
+                events.append(market_event)
+            self._gap_snapshots += 1
+            self._suppressed_events += len(events)
+            logger.info(
+                "스트림 갭을 건너는 비교라 %s 이벤트 %d건을 생략합니다.",
+                snapshot.symbol,
+                len(events),
+            )
+            return []
+        if settings.MARKET_SUPPRESS_SYMBOL_EVENTS:
+            events = self._suppress_market_duplicates(events)
+        if market_event:
+            events.append(market_event)
+        return events
+
+    def _release_symbols(self) -> None:
+        """구독 해제된 심볼의 캐시·지표·횡단면 슬롯을 감시 스레드에서 해제한다.
+
+        해제 직후 다시 구독된 심볼도 상태를 비운다. 새 틱보다 먼저 실행되므로
+        재구독 후 첫 틱은 해제 이전 가격과 비교되지 않는다.
+        """
+        while self._released:
+            symbol = self._released.popleft()
+            self._cache.pop(symbol, None)
+            self._indicators.remove(symbol)
+            self._cross_section.remove(symbol)
+
+    def flush_checkpoint(self) -> None:
+        """현재 상태를 바로 기록한다. 감시 루프가 멈춘 뒤에 호출해야 한다."""
+        if self._checkpoint:
+            self._checkpoint.flush(self._checkpoint_state())
+
+    async def flush_checkpoint_async(self) -> None:
+        """flush_checkpoint()의 asyncio 버전.
+
+        상태 사본은 감시 루프와 같은 이벤트 루프에서 만들고, 쓰기 완료 대기만
+        스레드로 넘겨 HTTP 서버 등 같은 루프의 작업을 막지 않는다.
+        """
+        if self._checkpoint:
+            import asyncio
+
+            await asyncio.to_thread(self._checkpoint.flush, self._checkpoint_state())
+
+    def _checkpoint_state(self) -> dict:
+        symbols = list(self._cache)
+        prices = array("d")
+        volumes = array("d")
+        timestamps = array("d")
+        for snapshot in self._cache.values():
+            prices.append(snapshot.price)
+            volumes.append(snapshot.volume)
+            timestamps.append((snapshot.timestamp - _EPOCH).total_seconds())
+        return {
+            "cache": {
+                "symbols": symbols,
+                "prices": prices,
+                "volumes": volumes,
+                "timestamps": timestamps,
+            },
+            "indicators": self._indicators.export_state(),
+            "cross_section": self._cross_section.export_state(),
+        }
+
+    def _restore_checkpoint(self) -> None:
+        """체크포인트가 충분히 최신이면 캐시와 롤링 상태를 복원해 첫 틱부터 비교할 수 있게 한다."""
+        state = load_checkpoint(
+            settings.CHECKPOINT_PATH,
+            max_age_seconds=settings.CHECKPOINT_MAX_AGE.total_seconds(),
+        )
+        if state is None:
+            return
+        try:
+            saved = state["cache"]
+            cache = {
+                str(symbol): MarketSnapshot(
+                    symbol=str(symbol),
+                    price=price,
+                    volume=volume,
+                    timestamp=_EPOCH + timedelta(seconds=timestamp),
+                )
+                for symbol, price, volume, timestamp in zip(
+                    saved["symbols"], saved["prices"], saved["volumes"], saved["timestamps"]
+                )
+            }
+            indicators = IndicatorEngine()
+            indicators.restore_state(state["indicators"])
+            cross_section = CrossSectionalMonitor()
+            cross_section.restore_state(state["cross_section"])
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
+            logger.warning("체크포인트 형식이 맞지 않아 무시합니다: %s", exc)
+            return
+        active = set(self._symbols)
+        for symbol in [symbol for symbol in cache if symbol not in active]:
+            del cache[symbol]
+        for symbol in [symbol for symbol in indicators.symbols() if symbol not in active]:
+            indicators.remove(symbol)
+        for symbol in [symbol for symbol in cross_section.symbols() if symbol not in active]:
+            cross_section.remove(symbol)
+        self._cache = cache
+        self._indicators = indicators
+        self._cross_section = cross_section
+        self._restored = set(cache)
+        logger.info("체크포인트에서 %d개 심볼 상태를 복원했습니다.", len(cache))
+
+    @staticmethod
+    def _is_stale_restore(snapshot: MarketSnapshot, previous: MarketSnapshot) -> bool:
+        """복원된 직전 스냅샷이 오래됐으면 첫 비교를 스트림 갭으로 취급한다."""
+        age = (snapshot.timestamp - previous.timestamp).total_seconds()
+        return age > settings.CHECKPOINT_RESUME_MAX_GAP.total_seconds()
+
+    def _suppress_market_duplicates(self, events: List[Event]) -> List[Event]:
+        """시장 전체 움직임이 진행 중이면 같은 방향의 심볼별 가격 이벤트를 생략한다."""
+        direction = self._cross_section.active_direction
+        if direction == 0:
+            return events
+        duplicate = EventType.PRICE_DROP if direction < 0 else EventType.PRICE_RISE
+        return [event for event in events if event.event_type != duplicate]
 
     def _evaluate(
         self, current: MarketSnapshot, previous: MarketSnapshot
     ) -> List[Event]:
         """등록된 모든 조건을 실행해 Event 리스트를 만든다."""
         events: List[Event] = []
+        hooks = HOOKS.condition_evaluated
         for condition in self._conditions:
-            event = condition(current, previous)
+            if hooks:
+                started = time.perf_counter()
+                event = condition(current, previous)
+                emit(hooks, condition, current, event, time.perf_counter() - started)
+            else:
+                event = condition(current, previous)
             if event:
                 events.append(event)
         return events
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import settings
+
+INTERVAL_SECONDS = {
+    "1s": 1,
+    "1m": 60,
+    "5m": 300,
+}
+
+
+@dataclass
+class Bar:
+    symbol: str
+    interval: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    trades: int
+    start: datetime
+    end: datetime
+
+
+def _ms_to_datetime(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+
+class BarSeries:
+    """심볼·주기 하나의 OHLCV 봉을 미리 할당된 링 버퍼에 누적한다.
+
+    이미 마감된 구간에 늦게 도착한 체결은 같은 시작 시각의 봉을 다시 열지 않도록
+    버리고 `late_trades`로만 센다.
+    """
+
+    __slots__ = (
+        "symbol",
+        "interval",
+        "_interval_ms",
+        "_capacity",
+        "_size",
+        "_head",
+        "_start",
+        "_open",
+        "_high",
+        "_low",
+        "_close",
+        "_volume",
+        "_trades",
+        "_current_start",
+        "_current",
+        "_closed_end",
+        "late_trades",
+    )
+
+    def __init__(self, symbol: str, interval: str, capacity: int) -> None:
+        if interval not in INTERVAL_SECONDS:
+            raise ValueError(f"Unsupported bar interval: {interval}")
+        self.symbol = symbol
+        self.interval = interval
+        self._interval_ms = INTERVAL_SECONDS[interval] * 1000
+        self._capacity = capacity
+        self._size = 0
+        self._head = 0
+        self._start = array("q", [0] * capacity)
+        self._open = array("d", [0.0] * capacity)
+        self._high = array("d", [0.0] * capacity)
+        self._low = array("d", [0.0] * capacity)
+        self._close = array("d", [0.0] * capacity)
+        self._volume = array("d", [0.0] * capacity)
+        self._trades = array("q", [0] * capacity)
+        self._current_start = -1
+        # open, high, low, close, volume, trades
+        self._current = array("d", [0.0] * 6)
+        self._closed_end = 0  # 마지막으로 마감된 봉의 끝 시각(ms)
+        self.late_trades = 0
+
+    def add_trade(self, price: float, quantity: float, trade_time_ms: int) -> Optional[Bar]:
+        """체결 한 건을 반영하고, 주기 경계를 넘었다면 마감된 봉을 반환한다."""
+        bucket = trade_time_ms - trade_time_ms % self._interval_ms
+        if bucket < self._closed_end:
+            self.late_trades += 1
+            return None
+        closed = None
+        if self._current_start < 0:
+            self._open_bar(bucket, price)
+        elif bucket > self._current_start:
+            closed = self._close_bar()
+            self._open_bar(bucket, price)
+
+        current = self._current
+        if price > current[1]:
+            current[1] = price
+        if price < current[2]:
+            current[2] = price
+        current[3] = price
+        current[4] += quantity
+        current[5] += 1
+        return closed
+
+    def flush(self, now_ms: int) -> Optional[Bar]:
+        """체결이 없어도 주기가 끝났다면 진행 중인 봉을 마감한다."""
+        if self._current_start < 0 or now_ms < self._current_start + self._interval_ms:
+            return None
+        closed = self._close_bar()
+        self._current_start = -1
+        return closed
+
+    def recent(self, count: int) -> List[Bar]:
+        """마감된 봉을 최신순으로 최대 count개 반환한다."""
+        bars: List[Bar] = []
+        for offset in range(min(count, self._size)):
+            index = (self._head - 1 - offset) % self._capacity
+            bars.append(self._bar_at(index))
+        return bars
+
+    def _open_bar(self, bucket: int, price: float) -> None:
+        self._current_start = bucket
+        current = self._current
+        current[0] = current[1] = current[2] = current[3] = price
+        current[4] = 0.0
+        current[5] = 0.0
+
+    def _close_bar(self) -> Bar:
+        index = self._head
+        current = self._current
+        self._start[index] = self._current_start
+        self._open[index] = current[0]
+        self._high[index] = current[1]
+        self._low[index] = current[2]
+        self._close[index] = current[3]
+        self._volume[index] = current[4]
+        self._trades[index] = int(current[5])
+        self._closed_end = self._current_start + self._interval_ms
+        self._head = (index + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+        return self._bar_at(index)
+
+    def _bar_at(self, index: int) -> Bar:
+        start = self._start[index]
+        return Bar(
+            symbol=self.symbol,
+            interval=self.interval,
+            open=self._open[index],
+            high=self._high[index],
+            low=self._low[index],
+            close=self._close[index],
+            volume=self._volume[index],
+            trades=self._trades[index],
+            start=_ms_to_datetime(start),
+            end=_ms_to_datetime(start + self._interval_ms),
+        )
+
+
+class BarAggregator:
+    """체결 스트림을 여러 주기의 OHLCV 봉으로 집계한다."""
+
+    def __init__(
+        self,
+        intervals: Iterable[str] | None = None,
+        *,
+        capacity: int | None = None,
+    ) -> None:
+        self._intervals = tuple(intervals or settings.TRADE_BAR_INTERVALS)
+        self._capacity = capacity or settings.TRADE_BAR_BUFFER_SIZE
+        self._series: Dict[Tuple[str, str], BarSeries] = {}
+
+    @property
+    def intervals(self) -> Tuple[str, ...]:
+        return self._intervals
+
+    def add_trade(
+        self, symbol: str, price: float, quantity: float, trade_time_ms: int
+    ) -> List[Bar]:
+        closed: List[Bar] = []
+        for interval in self._intervals:
+            bar = self.series(symbol, interval).add_trade(price, quantity, trade_time_ms)
+            if bar is not None:
+                closed.append(bar)
+        return closed
+
+    def flush(self, now_ms: int) -> List[Bar]:
+        closed: List[Bar] = []
+        for series in self._series.values():
+            bar = series.flush(now_ms)
+            if bar is not None:
+                closed.append(bar)
+        return closed
+
+    def late_trades(self) -> int:
+        """이미 마감된 봉 구간에 늦게 도착해 버려진 체결 수."""
+        return sum(series.late_trades for series in self._series.values())
+
+    def discard(self, symbol: str) -> None:
+        """심볼의 모든 주기 버퍼를 해제한다."""
+        for interval in self._intervals:
+            self._series.pop((symbol, interval), None)
+
+    def series(self, symbol: str, interval: str) -> BarSeries:
+        key = (symbol, interval)
+        series = self._series.get(key)
+        if series is None:
+            series = BarSeries(symbol, interval, self._capacity)
+            self._series[key] = series
+        return series
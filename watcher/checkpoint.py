@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 4
+
+_MAGIC = b"WCKP"
+_HEADER = struct.Struct("<4sI")
+_TYPECODES = frozenset("bd")
+
+
+class CheckpointWriter:
+    """워처 상태를 주기적으로 로컬 파일에 기록하는 백그라운드 writer.
+
+    감시 루프는 각 구성요소가 복사해 둔 배열·작은 dict만 넘기고 바로 돌아간다.
+    인코딩·압축·디스크 쓰기는 전용 스레드에서 처리하며, 밀린 체크포인트는
+    최신 것 하나만 남긴다. writer는 데몬 스레드이므로 종료 시 마지막 상태는
+    flush()로 기록을 마칠 때까지 기다린다.
+    """
+
+    def __init__(self, path: str, *, interval_seconds: float) -> None:
+        self._path = path
+        self._interval = interval_seconds
+        self._next_due = time.monotonic() + interval_seconds
+        self._pending: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1)
+        self._worker = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._worker.start()
+
+    def due(self) -> bool:
+        return time.monotonic() >= self._next_due
+
+    def submit(self, state: Dict[str, Any]) -> None:
+        """state는 호출 측이 만든 사본이어야 한다(이후 감시 루프가 바꾸지 않는 값)."""
+        self._next_due = time.monotonic() + self._interval
+        self._offer({"saved_at": time.time(), "state": state})
+
+    def flush(self, state: Dict[str, Any], *, timeout: float = 2.0) -> bool:
+        """상태를 즉시 기록하고 쓰기가 끝날 때까지 기다린다. 제시간에 끝나면 True."""
+        done = threading.Event()
+        self._next_due = time.monotonic() + self._interval
+        self._offer({"saved_at": time.time(), "state": state, "done": done})
+        return done.wait(timeout)
+
+    def _offer(self, item: Dict[str, Any]) -> None:
+        try:
+            self._pending.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._pending.put_nowait(item)
+        except queue.Full:  # pragma: no cover - single producer
+            pass
+
+    def _run(self) -> None:
+        while True:
+            item = self._pending.get()
+            temp_path = f"{self._path}.tmp"
+            try:
+                payload = encode_checkpoint(item["state"], saved_at=item["saved_at"])
+                with open(temp_path, "wb") as handle:
+                    handle.write(payload)
+                os.replace(temp_path, self._path)
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("체크포인트 저장에 실패했습니다: %s", exc)
+            finally:
+                done = item.get("done")
+                if done is not None:
+                    done.set()
+
+
+def encode_checkpoint(state: Dict[str, Any], *, saved_at: float) -> bytes:
+    """JSON 헤더 + 배열 원시 바이트로 인코딩한다. 코드 실행이 가능한 pickle은 쓰지 않는다."""
+    blobs: List[bytes] = []
+    manifest: List[Tuple[str, int]] = []
+
+    def lift(value: Any) -> Any:
+        if isinstance(value, array):
+            manifest.append((value.typecode, len(value)))
+            blobs.append(value.tobytes())
+            return {"__array__": len(manifest) - 1}
+        if isinstance(value, dict):
+            return {str(key): lift(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [lift(item) for item in value]
+        return value
+
+    header = json.dumps(
+        {
+            "version": CHECKPOINT_VERSION,
+            "saved_at": saved_at,
+            "arrays": manifest,
+            "state": lift(state),
+        },
+        allow_nan=True,
+    ).encode("utf-8")
+    body = _HEADER.pack(_MAGIC, len(header)) + header + b"".join(blobs)
+    return zlib.compress(body, 1)
+
+
+def decode_checkpoint(payload: bytes) -> Dict[str, Any]:
+    body = zlib.decompress(payload)
+    magic, header_size = _HEADER.unpack_from(body)
+    if magic != _MAGIC:
+        raise ValueError("not a watcher checkpoint")
+    offset = _HEADER.size
+    header = json.loads(body[offset : offset + header_size].decode("utf-8"))
+    offset += header_size
+
+    arrays: List[array] = []
+    for typecode, length in header["arrays"]:
+        if typecode not in _TYPECODES:
+            raise ValueError(f"unsupported array type {typecode!r}")
+        values = array(typecode)
+        size = values.itemsize * int(length)
+        values.frombytes(body[offset : offset + size])
+        if len(values) != length:
+            raise ValueError("truncated checkpoint")
+        arrays.append(values)
+        offset += size
+
+    def lower(value: Any) -> Any:
+        if isinstance(value, dict):
+            if set(value) == {"__array__"}:
+                return arrays[value["__array__"]]
+            return {key: lower(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [lower(item) for item in value]
+        return value
+
+    header["state"] = lower(header["state"])
+    return header
+
+
+def load_checkpoint(path: str, *, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+    """체크포인트를 읽어 상태 dict를 반환한다. 없거나 오래됐거나 손상되면 None."""
+    try:
+        with open(path, "rb") as handle:
+            data = decode_checkpoint(handle.read())
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("체크포인트를 읽을 수 없어 무시합니다: %s", exc)
+        return None
+
+    if data.get("version") != CHECKPOINT_VERSION:
+        logger.warning("체크포인트 버전이 맞지 않아 무시합니다.")
+        return None
+    age = time.time() - float(data.get("saved_at", 0))
+    if age > max_age_seconds:
+        logger.info("체크포인트가 %.0f초 전 것이라 무시합니다.", age)
+        return None
+    return data.get("state")
@@ -6,18 +6,29 @@ import queue
 import random
 import threading
 import time
+from collections import deque
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from threading import Event as ThreadEvent
-from typing import Iterable, Iterator, Optional, Protocol
-from urllib import error, request
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+)
 
 from config import settings
+from watcher.bars import INTERVAL_SECONDS, Bar, BarAggregator
 from watcher.models import MarketSnapshot
+from watcher.orderbook import OrderBook
 
-try:
-    import websocket  # type: ignore
-except Exception:  # pragma: no cover - optional dependency
-    websocket = None
+if TYPE_CHECKING:
+    import asyncio
 
 
 class MarketDataClient(Protocol):
@@ -26,47 +37,290 @@ class MarketDataClient(Protocol):
     ) -> Iterator[MarketSnapshot]:
         ...
 
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        ...
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        ...
+
+
+class AsyncMarketDataClient(Protocol):
+    def stream_ticker_async(
+        self, symbols: Iterable[str], stop_event: asyncio.Event | None = None
+    ) -> AsyncIterator[MarketSnapshot]:
+        ...
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        ...
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        ...
+
+
+class ThreadedAsyncClient:
+    """블로킹 클라이언트를 전용 스레드에서 돌리고 스냅샷을 asyncio.Queue로 넘긴다.
+
+    websocket-client/urllib처럼 스레드 기반인 백엔드를 이벤트 루프에 붙이기 위한
+    어댑터다. 큐에 쌓인 스냅샷 수는 queue_size로 제한해 소비가 느리면 생산 스레드가
+    기다린다.
+    """
+
+    def __init__(self, client: MarketDataClient, *, queue_size: int) -> None:
+        self._client = client
+        self._queue_size = queue_size
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        self._client.subscribe(symbols)
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        self._client.unsubscribe(symbols)
+
+    async def stream_ticker_async(
+        self, symbols: Iterable[str], stop_event: asyncio.Event | None = None
+    ) -> AsyncIterator[MarketSnapshot]:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        snapshots: "asyncio.Queue[Optional[MarketSnapshot]]" = asyncio.Queue()
+        slots = threading.Semaphore(self._queue_size)
+        thread_stop = ThreadEvent()
+        failure: List[BaseException] = []
+        symbols = list(symbols)
+
+        def pump() -> None:
+            try:
+                for snapshot in self._client.stream_ticker(symbols, stop_event=thread_stop):
+                    while not slots.acquire(timeout=0.5):
+                        if thread_stop.is_set():
+                            return
+                    loop.call_soon_threadsafe(snapshots.put_nowait, snapshot)
+                    if thread_stop.is_set():
+                        return
+            except BaseException as exc:  # pragma: no cover - surfaced to the consumer
+                failure.append(exc)
+            finally:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(snapshots.put_nowait, None)
+
+        stopper: Optional[asyncio.Future] = None
+        if stop_event is not None:
+            stopper = asyncio.ensure_future(stop_event.wait())
+            stopper.add_done_callback(lambda _: snapshots.put_nowait(None))
+        worker = threading.Thread(target=pump, name="market-data-pump", daemon=True)
+        worker.start()
+        try:
+            while True:
+                snapshot = await snapshots.get()
+                if snapshot is None:
+                    break
+                slots.release()
+                yield snapshot
+            if failure:
+                raise failure[0]
+        finally:
+            thread_stop.set()
+            if stopper is not None:
+                stopper.cancel()
+
+
+def as_async_client(client: MarketDataClient) -> AsyncMarketDataClient:
+    """네이티브 비동기 스트림이 있으면 그대로, 없으면 스레드 어댑터로 감싼다."""
+    if hasattr(client, "stream_ticker_async"):
+        return client  # type: ignore[return-value]
+    return ThreadedAsyncClient(client, queue_size=settings.ASYNC_QUEUE_SIZE)
+
+
+class SubscriptionSet:
+    """스트리밍 중에 다른 스레드에서 바꿀 수 있는 구독 심볼 목록."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._symbols: List[str] = []
+        self._members: frozenset[str] = frozenset()
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._members
+
+    def reset(self, symbols: Iterable[str]) -> List[str]:
+        with self._lock:
+            self._symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+            self._members = frozenset(self._symbols)
+            return list(self._symbols)
+
+    def add(self, symbols: Iterable[str]) -> List[str]:
+        """새로 추가된 심볼만 반환한다."""
+        with self._lock:
+            added = [
+                symbol
+                for symbol in dict.fromkeys(symbol.upper() for symbol in symbols)
+                if symbol not in self._symbols
+            ]
+            self._symbols.extend(added)
+            self._members = frozenset(self._symbols)
+            return added
+
+    def remove(self, symbols: Iterable[str]) -> List[str]:
+        """실제로 제거된 심볼만 반환한다."""
+        with self._lock:
+            targets = {symbol.upper() for symbol in symbols}
+            removed = [symbol for symbol in self._symbols if symbol in targets]
+            self._symbols = [symbol for symbol in self._symbols if symbol not in targets]
+            self._members = frozenset(self._symbols)
+            return removed
+
+    def current(self) -> List[str]:
+        with self._lock:
+            return list(self._symbols)
+
+
+@dataclass
+class StreamGapMetrics:
+    reconnects: int = 0
+    last_outage_seconds: float = 0.0
+    total_outage_seconds: float = 0.0
+    backfilled_symbols: int = 0
+    flagged_snapshots: int = 0
+
+
+class GapTracker:
+    """재연결로 틱이 유실된 심볼을 추적한다.
+
+    수신 스레드가 재연결 시 `mark`하고, 소비 측은 `take_pending`으로 REST
+    백필 대상을 가져오며 `consume`으로 첫 재연결 틱에 갭 플래그를 붙인다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._gapped: set[str] = set()
+        self._pending: List[str] = []
+        self.metrics = StreamGapMetrics()
+
+    def mark(self, symbols: Iterable[str], outage_seconds: float) -> None:
+        with self._lock:
+            symbols = list(symbols)
+            self._gapped.update(symbols)
+            self._pending = list(self._gapped)
+            self.metrics.reconnects += 1
+            self.metrics.last_outage_seconds = outage_seconds
+            self.metrics.total_outage_seconds += outage_seconds
+
+    def take_pending(self) -> List[str]:
+        if not self._pending:
+            return []
+        with self._lock:
+            pending, self._pending = self._pending, []
+            return pending
+
+    def resolve(self, symbol: str) -> None:
+        """REST로 새 기준값을 받은 심볼의 갭 표시를 지운다."""
+        with self._lock:
+            if symbol in self._gapped:
+                self._gapped.discard(symbol)
+                self.metrics.backfilled_symbols += 1
+
+    def consume(self, symbol: str) -> bool:
+        """심볼의 다음 틱이 갭을 건너 비교되는지 반환하고 표시를 지운다."""
+        if not self._gapped:
+            return False
+        with self._lock:
+            if symbol not in self._gapped:
+                return False
+            self._gapped.discard(symbol)
+            self.metrics.flagged_snapshots += 1
+            return True
+
+    def discard(self, symbols: Iterable[str]) -> None:
+        with self._lock:
+            self._gapped.difference_update(symbols)
+
 
 class MockBinanceClient:
     def __init__(self, *, poll_interval_seconds: float):
         self._poll_interval = poll_interval_seconds
+        self._subscriptions = SubscriptionSet()
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        self._subscriptions.add(symbols)
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        self._subscriptions.remove(symbols)
 
     def stream_ticker(
         self, symbols: Iterable[str], stop_event: ThreadEvent | None = None
     ) -> Iterator[MarketSnapshot]:
-        base_prices = {symbol: 30000.0 for symbol in symbols}
-        base_volumes = {symbol: 1000.0 for symbol in symbols}
+        base_prices: dict[str, float] = {}
+        base_volumes: dict[str, float] = {}
+        self._subscriptions.reset(symbols)
 
         while True:
             if stop_event and stop_event.is_set():
                 return
-            for symbol in symbols:
+            for snapshot in self._next_snapshots(base_prices, base_volumes):
                 if stop_event and stop_event.is_set():
                     return
-                base_prices[symbol] *= 1 + random.uniform(-0.03, 0.03)
-                base_volumes[symbol] *= 1 + random.uniform(-0.3, 0.3)
-                yield MarketSnapshot(
+                yield snapshot
+
+            time.sleep(self._poll_interval)
+
+    async def stream_ticker_async(
+        self, symbols: Iterable[str], stop_event: asyncio.Event | None = None
+    ) -> AsyncIterator[MarketSnapshot]:
+        import asyncio
+
+        base_prices: dict[str, float] = {}
+        base_volumes: dict[str, float] = {}
+        self._subscriptions.reset(symbols)
+
+        while not (stop_event and stop_event.is_set()):
+            for snapshot in self._next_snapshots(base_prices, base_volumes):
+                yield snapshot
+            await asyncio.sleep(self._poll_interval)
+
+    def _next_snapshots(
+        self, base_prices: dict[str, float], base_volumes: dict[str, float]
+    ) -> List[MarketSnapshot]:
+        active = self._subscriptions.current()
+        for symbol in list(base_prices):
+            if symbol not in active:
+                del base_prices[symbol]
+                del base_volumes[symbol]
+        snapshots: List[MarketSnapshot] = []
+        for symbol in active:
+            base_prices.setdefault(symbol, 30000.0)
+            base_volumes.setdefault(symbol, 1000.0)
+            base_prices[symbol] *= 1 + random.uniform(-0.03, 0.03)
+            base_volumes[symbol] *= 1 + random.uniform(-0.3, 0.3)
+            snapshots.append(
+                MarketSnapshot(
                     symbol=symbol,
                     price=round(base_prices[symbol], 2),
                     volume=max(round(base_volumes[symbol], 2), 1.0),
                     timestamp=datetime.utcnow(),
                 )
-
-            time.sleep(self._poll_interval)
+            )
+        return snapshots
 
 
 class BinanceRestClient:
     def __init__(self, *, base_url: str, poll_interval_seconds: float):
         self._base_url = base_url.rstrip("/")
         self._poll_interval = poll_interval_seconds
+        self._subscriptions = SubscriptionSet()
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        self._subscriptions.add(symbols)
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        self._subscriptions.remove(symbols)
 
     def stream_ticker(
         self, symbols: Iterable[str], stop_event: ThreadEvent | None = None
     ) -> Iterator[MarketSnapshot]:
+        self._subscriptions.reset(symbols)
         while True:
             if stop_event and stop_event.is_set():
                 return
-            for symbol in symbols:
+            for symbol in self._subscriptions.current():
                 if stop_event and stop_event.is_set():
                     return
                 snapshot = self._fetch_snapshot(symbol)
@@ -75,6 +329,8 @@ class BinanceRestClient:
             time.sleep(self._poll_interval)
 
     def _fetch_snapshot(self, symbol: str) -> Optional[MarketSnapshot]:
+        from urllib import error, request
+
         endpoint = f"{self._base_url}/api/v3/ticker/24hr?symbol={symbol.upper()}"
         try:
             with request.urlopen(endpoint, timeout=10) as response:
@@ -95,25 +351,145 @@ class BinanceRestClient:
             price=price,
             volume=volume,
             timestamp=datetime.utcnow(),
+            cumulative_volume=True,
         )
 
 
 class BinanceWebSocketClient:
-    def __init__(self, *, stream_base_url: str, reconnect_delay_seconds: float):
-        if websocket is None:
-            raise RuntimeError(
-                "websocket-client is required for the WebSocket backend. "
-                "Install it with `pip install websocket-client`."
-            )
+    """Binance 결합 스트림 클라이언트.
+
+    `payload_source`(녹화된 메시지 dict의 iterable)를 주입하면 WebSocket 연결 대신
+    그 메시지를 순서대로 재생하며, 이 경우 websocket-client가 없어도 동작한다.
+    """
+
+    _stream_suffixes: tuple[str, ...] = ("ticker",)
+
+    def __init__(
+        self,
+        *,
+        stream_base_url: str,
+        reconnect_delay_seconds: float,
+        rest_base_url: str | None = None,
+        payload_source: Iterable[dict] | None = None,
+    ):
+        self._payload_source = payload_source
+        self._websocket = None
+        if payload_source is None:
+            try:
+                import websocket  # type: ignore
+            except Exception:  # pragma: no cover - optional dependency
+                raise RuntimeError(
+                    "websocket-client is required for the WebSocket backend. "
+                    "Install it with `pip install websocket-client`."
+                )
+            self._websocket = websocket
         self._stream_base_url = stream_base_url.rstrip("/")
         self._reconnect_delay = reconnect_delay_seconds
+        self._subscriptions = SubscriptionSet()
+        self._ws = None
+        self._request_id = 0
+        self._ws_lock = threading.Lock()
+        self._gaps = GapTracker()
+        self._backfill_client = (
+            BinanceRestClient(base_url=rest_base_url, poll_interval_seconds=0.0)
+            if rest_base_url
+            else None
+        )
+
+    def gap_metrics(self) -> dict[str, float]:
+        return asdict(self._gaps.metrics)
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        """연결을 유지한 채 SUBSCRIBE 제어 메시지로 심볼을 추가한다."""
+        added = self._subscriptions.add(symbols)
+        if added:
+            self._send_control("SUBSCRIBE", added)
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        """연결을 유지한 채 UNSUBSCRIBE 제어 메시지로 심볼을 제거한다."""
+        removed = self._subscriptions.remove(symbols)
+        if removed:
+            self._send_control("UNSUBSCRIBE", removed)
+            self._gaps.discard(removed)
+            self._on_unsubscribed(removed)
+
+    def _on_unsubscribed(self, symbols: List[str]) -> None:
+        """구독 해제된 심볼의 클라이언트 측 상태를 정리한다. 하위 클래스에서 확장한다."""
+
+    def _stream_names(self, symbols: Iterable[str]) -> List[str]:
+        return [
+            f"{symbol.lower()}@{suffix}"
+            for symbol in symbols
+            for suffix in self._stream_suffixes
+        ]
+
+    def _send_control(self, method: str, symbols: List[str]) -> None:
+        with self._ws_lock:
+            ws = self._ws
+            self._request_id += 1
+            message = json.dumps(
+                {"method": method, "params": self._stream_names(symbols), "id": self._request_id}
+            )
+        if ws is None:
+            return  # 다음 연결 URL에 반영된다.
+        try:
+            ws.send(message)
+        except Exception as exc:
+            logging.warning("Failed to send %s for %s: %s", method, symbols, exc)
 
     def stream_ticker(
         self, symbols: Iterable[str], stop_event: ThreadEvent | None = None
     ) -> Iterator[MarketSnapshot]:
-        symbol_list = [symbol.upper() for symbol in symbols]
-        stream = "/".join(f"{symbol.lower()}@ticker" for symbol in symbol_list)
-        url = f"{self._stream_base_url}?streams={stream}"
+        for data in self._stream_payloads(symbols, stop_event):
+            yield from self._backfill_gaps()
+            if data is None:
+                continue
+            snapshot = _ticker_to_snapshot(data)
+            if snapshot is not None:
+                snapshot.gap = self._gaps.consume(snapshot.symbol)
+                yield snapshot
+
+    def _backfill_gaps(self) -> List[MarketSnapshot]:
+        """재연결 후 갭 심볼의 새 기준 스냅샷을 REST로 동시에 받아온다.
+
+        기준 스냅샷 자체는 gap=True로 표시해 비교를 건너뛰게 하고, 받아오지 못한
+        심볼은 다음 WebSocket 틱에 갭 플래그가 붙는다.
+        """
+        symbols = self._gaps.take_pending()
+        if not symbols or self._backfill_client is None:
+            return []
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(len(symbols), settings.GAP_BACKFILL_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._backfill_client._fetch_snapshot, symbols))
+        baselines: List[MarketSnapshot] = []
+        for snapshot in results:
+            if snapshot is None or snapshot.symbol not in self._subscriptions:
+                continue
+            snapshot.gap = True
+            self._gaps.resolve(snapshot.symbol)
+            baselines.append(snapshot)
+        logging.info("Backfilled %d/%d symbols after reconnect.", len(baselines), len(symbols))
+        return baselines
+
+    def _stream_payloads(
+        self,
+        symbols: Iterable[str],
+        stop_event: ThreadEvent | None = None,
+        *,
+        idle_timeout: float = 1.0,
+    ) -> Iterator[Optional[dict]]:
+        """WebSocket 메시지를 수신 스레드에서 받아 dict로 넘긴다. 유휴 시에는 None을 보낸다."""
+        self._subscriptions.reset(symbols)
+        if self._payload_source is not None:
+            for payload in self._payload_source:
+                if stop_event and stop_event.is_set():
+                    return
+                data = _unwrap_payload(payload)
+                if data is not None:
+                    yield data
+            return
 
         message_queue: "queue.Queue[dict]" = queue.Queue()
         internal_stop = threading.Event()
@@ -128,28 +504,43 @@ class BinanceWebSocketClient:
                 logging.warning("Unable to decode WebSocket payload: %s", message)
                 return
 
-            data = payload.get("data") if isinstance(payload, dict) else None
-            if not data and isinstance(payload, dict):
-                data = payload  # direct stream (single subscription)
-
-            if not isinstance(data, dict):
-                return
-
-            message_queue.put(data)
+            data = _unwrap_payload(payload)
+            if data is not None:
+                message_queue.put(data)
 
         def on_error(_: object, exc: Exception) -> None:
             logging.warning("WebSocket error: %s", exc)
 
+        disconnected_at: Optional[float] = None
+
+        def on_open(_: object) -> None:
+            nonlocal disconnected_at
+            if disconnected_at is None:
+                return
+            outage = time.monotonic() - disconnected_at
+            disconnected_at = None
+            self._gaps.mark(self._subscriptions.current(), outage)
+            logging.info("WebSocket reconnected after %.1fs outage; marking gap.", outage)
+
         def run() -> None:
+            nonlocal disconnected_at
             while not should_stop():
-                ws = websocket.WebSocketApp(
-                    url,
+                stream = "/".join(self._stream_names(self._subscriptions.current()))
+                ws = self._websocket.WebSocketApp(
+                    f"{self._stream_base_url}?streams={stream}",
+                    on_open=on_open,
                     on_message=on_message,
                     on_error=on_error,
                 )
+                with self._ws_lock:
+                    self._ws = ws
                 ws.run_forever()
+                with self._ws_lock:
+                    self._ws = None
                 if should_stop():
                     break
+                if disconnected_at is None:
+                    disconnected_at = time.monotonic()
                 logging.info("WebSocket disconnected; retrying in %.1fs", self._reconnect_delay)
                 time.sleep(self._reconnect_delay)
 
@@ -161,7 +552,7 @@ class BinanceWebSocketClient:
                 if should_stop():
                     break
                 try:
-                    data = message_queue.get(timeout=1.0)
+                    data = message_queue.get(timeout=idle_timeout)
                 except queue.Empty:
                     if should_stop():
                         break
@@ -169,29 +560,266 @@ class BinanceWebSocketClient:
                         logging.warning("WebSocket worker stopped unexpectedly.")
                         worker = threading.Thread(target=run, daemon=True)
                         worker.start()
+                    yield None
                     continue
 
-                symbol = data.get("s")
-                price = data.get("c") or data.get("p")
-                volume = data.get("v")
-                event_time = data.get("E")
+                yield data
+        finally:
+            internal_stop.set()
+
 
-                if not symbol or price is None or volume is None:
-                    continue
+class BinanceTradeStreamClient(BinanceWebSocketClient):
+    """`@aggTrade` 체결 스트림을 받아 OHLCV 봉을 만들고, 평가 주기 봉이 마감될 때만 스냅샷을 낸다.
 
-                try:
-                    snapshot = MarketSnapshot(
-                        symbol=symbol.upper(),
-                        price=float(price),
-                        volume=float(volume),
-                        timestamp=_event_time_to_datetime(event_time),
+    스냅샷의 volume은 24시간 누적치가 아니라 해당 봉의 체결량이므로
+    거래량 조건이 실제 급증을 감지할 수 있다.
+    """
+
+    _stream_suffixes = ("aggTrade",)
+
+    def __init__(
+        self,
+        *,
+        stream_base_url: str,
+        reconnect_delay_seconds: float,
+        intervals: Iterable[str] | None = None,
+        evaluation_interval: str | None = None,
+        close_grace_seconds: float | None = None,
+    ):
+        super().__init__(
+            stream_base_url=stream_base_url,
+            reconnect_delay_seconds=reconnect_delay_seconds,
+        )
+        # 24시간 티커 스냅샷은 봉과 비교할 수 없으므로 REST 백필 없이 갭 플래그만 붙인다.
+        self._bars = BarAggregator(intervals)
+        self._evaluation_interval = evaluation_interval or settings.TRADE_BAR_EVALUATION_INTERVAL
+        if self._evaluation_interval not in self._bars.intervals:
+            raise ValueError(
+                f"Evaluation interval {self._evaluation_interval} is not aggregated."
+            )
+        if close_grace_seconds is None:
+            close_grace_seconds = settings.TRADE_BAR_CLOSE_GRACE.total_seconds()
+        self._close_grace_ms = int(close_grace_seconds * 1000)
+
+    @property
+    def bars(self) -> BarAggregator:
+        return self._bars
+
+    def gap_metrics(self) -> dict[str, float]:
+        metrics = super().gap_metrics()
+        metrics["late_trades"] = self._bars.late_trades()
+        return metrics
+
+    def _on_unsubscribed(self, symbols: List[str]) -> None:
+        for symbol in symbols:
+            self._bars.discard(symbol)
+
+    def stream_ticker(
+        self, symbols: Iterable[str], stop_event: ThreadEvent | None = None
+    ) -> Iterator[MarketSnapshot]:
+        # 조용한 심볼의 봉도 제때 마감되도록, 체결 유무와 상관없이 최소 주기의 절반마다
+        # 벽시계 기준으로 flush한다.
+        flush_every = min(INTERVAL_SECONDS[interval] for interval in self._bars.intervals) / 2
+        next_flush = time.monotonic() + flush_every
+        for data in self._stream_payloads(symbols, stop_event, idle_timeout=flush_every):
+            closed = self._handle_trade(data) if data is not None else []
+            now = time.monotonic()
+            if now >= next_flush:
+                next_flush = now + flush_every
+                closed.extend(self._bars.flush(int(time.time() * 1000) - self._close_grace_ms))
+            for bar in closed:
+                if bar.interval == self._evaluation_interval:
+                    yield MarketSnapshot(
+                        symbol=bar.symbol,
+                        price=bar.close,
+                        volume=bar.volume,
+                        timestamp=bar.end,
+                        bar=bar,
+                        gap=self._gaps.consume(bar.symbol),
                     )
-                except ValueError:
-                    continue
 
-                yield snapshot
-        finally:
-            internal_stop.set()
+    def _handle_trade(self, data: dict) -> List[Bar]:
+        symbol = data.get("s")
+        price = data.get("p")
+        quantity = data.get("q")
+        trade_time = data.get("T") or data.get("E")
+        if not symbol or price is None or quantity is None or not trade_time:
+            return []
+        if symbol.upper() not in self._subscriptions:
+            return []
+        try:
+            return self._bars.add_trade(
+                symbol.upper(), float(price), float(quantity), int(trade_time)
+            )
+        except ValueError:
+            return []
+
+
+class BinanceDepthClient(BinanceWebSocketClient):
+    """`@ticker`와 `@depth` diff 스트림을 한 연결로 받아 심볼별 로컬 호가창을 유지한다.
+
+    티커 메시지마다 스냅샷을 내고, 그 시점의 호가 요약(BookView)을 `book`에 붙인다.
+    `payload_source`와 `snapshot_fetcher`를 함께 주입하면 네트워크 없이 녹화/로컬
+    피드만으로 동기화·갭·재동기화 과정을 재생할 수 있다.
+    """
+
+    _stream_suffixes = ("ticker", "depth@100ms")
+
+    def __init__(
+        self,
+        *,
+        stream_base_url: str,
+        reconnect_delay_seconds: float,
+        rest_base_url: str,
+        depth_levels: int | None = None,
+        snapshot_fetcher: Callable[[str], Optional[dict]] | None = None,
+        payload_source: Iterable[dict] | None = None,
+    ):
+        super().__init__(
+            stream_base_url=stream_base_url,
+            reconnect_delay_seconds=reconnect_delay_seconds,
+            rest_base_url=rest_base_url,
+            payload_source=payload_source,
+        )
+        self._rest_base_url = rest_base_url.rstrip("/")
+        self._depth_levels = depth_levels or settings.ORDER_BOOK_DEPTH_LEVELS
+        self._fetch_depth_snapshot = snapshot_fetcher or self._fetch_rest_depth
+        self._books: dict[str, OrderBook] = {}
+        self._pending: dict[str, Deque[dict]] = {}
+        self._last_resync: dict[str, float] = {}
+
+    def book(self, symbol: str) -> Optional[OrderBook]:
+        return self._books.get(symbol.upper())
+
+    def _on_unsubscribed(self, symbols: List[str]) -> None:
+        for symbol in symbols:
+            self._books.pop(symbol, None)
+            self._pending.pop(symbol, None)
+            self._last_resync.pop(symbol, None)
+
+    def stream_ticker(
+        self, symbols: Iterable[str], stop_event: ThreadEvent | None = None
+    ) -> Iterator[MarketSnapshot]:
+        for data in self._stream_payloads(symbols, stop_event):
+            yield from self._backfill_gaps()
+            if data is None:
+                continue
+            if data.get("e") == "depthUpdate":
+                self._handle_depth(data)
+                continue
+            snapshot = _ticker_to_snapshot(data)
+            if snapshot is None:
+                continue
+            snapshot.gap = self._gaps.consume(snapshot.symbol)
+            book = self._books.get(snapshot.symbol)
+            snapshot.book = book.view(self._depth_levels) if book else None
+            yield snapshot
+
+    def _handle_depth(self, data: dict) -> None:
+        symbol = (data.get("s") or "").upper()
+        if not symbol or "U" not in data or "u" not in data:
+            return
+        if symbol not in self._subscriptions:
+            return
+        book = self._books.get(symbol)
+        if book is None:
+            book = self._books[symbol] = OrderBook(symbol)
+        try:
+            if book.synced and _apply_depth_event(book, data):
+                return
+        except (IndexError, TypeError, ValueError) as exc:
+            # 일부 레벨만 반영됐을 수 있으므로 호가창을 버리고 다음 diff에서 재동기화한다.
+            logging.warning("Dropping malformed depth update for %s: %s", symbol, exc)
+            book.synced = False
+            return
+
+        pending = self._pending.get(symbol)
+        if pending is None:
+            pending = self._pending[symbol] = deque(maxlen=settings.ORDER_BOOK_MAX_PENDING)
+        pending.append(data)
+        self._resync(book, pending)
+
+    def _resync(self, book: OrderBook, pending: Deque[dict]) -> None:
+        now = time.monotonic()
+        if now - self._last_resync.get(book.symbol, 0.0) < settings.ORDER_BOOK_RESYNC_INTERVAL:
+            return
+        self._last_resync[book.symbol] = now
+
+        snapshot = self._fetch_depth_snapshot(book.symbol)
+        if snapshot is None:
+            return
+        try:
+            book.load_snapshot(
+                int(snapshot["lastUpdateId"]), snapshot.get("bids", []), snapshot.get("asks", [])
+            )
+        except (KeyError, IndexError, TypeError, ValueError):
+            logging.warning("Malformed depth snapshot for %s", book.symbol)
+            book.synced = False
+            return
+
+        while pending:
+            event = pending.popleft()
+            try:
+                applied = _apply_depth_event(book, event)
+            except (IndexError, TypeError, ValueError) as exc:
+                logging.warning("Dropping malformed depth update for %s: %s", book.symbol, exc)
+                book.synced = False
+                return
+            if not applied:
+                pending.appendleft(event)
+                logging.info("Depth snapshot for %s is stale; waiting to resync.", book.symbol)
+                return
+        logging.info("Order book synced: %s (lastUpdateId=%d)", book.symbol, book.last_update_id)
+
+    def _fetch_rest_depth(self, symbol: str) -> Optional[dict]:
+        from urllib import error, request
+
+        endpoint = (
+            f"{self._rest_base_url}/api/v3/depth?symbol={symbol.upper()}"
+            f"&limit={settings.BINANCE_DEPTH_SNAPSHOT_LIMIT}"
+        )
+        try:
+            with request.urlopen(endpoint, timeout=10) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except (error.URLError, json.JSONDecodeError) as exc:
+            logging.warning("Depth snapshot request failed for %s: %s", symbol, exc)
+            return None
+
+
+def _apply_depth_event(book: OrderBook, event: dict) -> bool:
+    """diff 이벤트를 적용한다. 형식이 잘못되면 ValueError/TypeError/IndexError를 낸다."""
+    return book.apply_diff(
+        int(event["U"]), int(event["u"]), event.get("b", []), event.get("a", [])
+    )
+
+
+def _unwrap_payload(payload: object) -> Optional[dict]:
+    """결합 스트림 메시지({"stream", "data"})와 단일 스트림 메시지를 모두 dict로 푼다."""
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not data and isinstance(payload, dict):
+        data = payload  # direct stream (single subscription)
+    return data if isinstance(data, dict) else None
+
+
+def _ticker_to_snapshot(data: dict) -> Optional[MarketSnapshot]:
+    symbol = data.get("s")
+    price = data.get("c") or data.get("p")
+    volume = data.get("v")
+    event_time = data.get("E")
+
+    if not symbol or price is None or volume is None:
+        return None
+
+    try:
+        return MarketSnapshot(
+            symbol=symbol.upper(),
+            price=float(price),
+            volume=float(volume),
+            timestamp=_event_time_to_datetime(event_time),
+            cumulative_volume=True,
+        )
+    except ValueError:
+        return None
 
 
 def _event_time_to_datetime(event_time: Optional[int]) -> datetime:
@@ -201,25 +829,48 @@ def _event_time_to_datetime(event_time: Optional[int]) -> datetime:
 
 
 def build_default_client() -> MarketDataClient:
-    backend = settings.MARKET_DATA_BACKEND.lower()
+    return build_client(settings.MARKET_DATA_BACKEND)
 
-    if backend == "binance_ws":
-        try:
-            return BinanceWebSocketClient(
-                stream_base_url=settings.BINANCE_STREAM_BASE_URL,
-                reconnect_delay_seconds=settings.STREAM_RECONNECT_DELAY.total_seconds(),
-            )
-        except Exception as exc:
-            logging.warning("Falling back to REST client: %s", exc)
-            backend = "binance_rest"
 
-    if backend == "binance_rest":
-        return BinanceRestClient(
-            base_url=settings.BINANCE_REST_BASE_URL,
-            poll_interval_seconds=settings.POLL_INTERVAL.total_seconds(),
-        )
+def build_client(backend: str) -> MarketDataClient:
+    """config.backends 레지스트리에서 backend를 찾아 그 모듈만 import해 생성한다."""
+    from config.backends import MARKET_DATA_BACKENDS
+
+    return MARKET_DATA_BACKENDS.create(backend)
 
+
+def create_mock_client() -> MockBinanceClient:
     logging.info("Using mock market data backend.")
     return MockBinanceClient(
         poll_interval_seconds=settings.POLL_INTERVAL.total_seconds(),
     )
+
+
+def create_rest_client() -> BinanceRestClient:
+    return BinanceRestClient(
+        base_url=settings.BINANCE_REST_BASE_URL,
+        poll_interval_seconds=settings.POLL_INTERVAL.total_seconds(),
+    )
+
+
+def create_websocket_client() -> BinanceWebSocketClient:
+    return BinanceWebSocketClient(
+        stream_base_url=settings.BINANCE_STREAM_BASE_URL,
+        reconnect_delay_seconds=settings.STREAM_RECONNECT_DELAY.total_seconds(),
+        rest_base_url=settings.BINANCE_REST_BASE_URL,
+    )
+
+
+def create_trade_stream_client() -> BinanceTradeStreamClient:
+    return BinanceTradeStreamClient(
+        stream_base_url=settings.BINANCE_STREAM_BASE_URL,
+        reconnect_delay_seconds=settings.STREAM_RECONNECT_DELAY.total_seconds(),
+    )
+
+
+def create_depth_client() -> BinanceDepthClient:
+    return BinanceDepthClient(
+        stream_base_url=settings.BINANCE_STREAM_BASE_URL,
+        reconnect_delay_seconds=settings.STREAM_RECONNECT_DELAY.total_seconds(),
+        rest_base_url=settings.BINANCE_REST_BASE_URL,
+    )
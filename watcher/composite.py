@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from threading import Event as ThreadEvent
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import settings
+from watcher.models import MarketSnapshot
+
+if TYPE_CHECKING:
+    from watcher.clients import MarketDataClient
+
+logger = logging.getLogger(__name__)
+
+_HeapEntry = Tuple[datetime, int, float, str, MarketSnapshot]
+
+
+class CompositeMarketDataClient:
+    """여러 MarketDataClient를 각자의 리더 스레드로 돌리고 스냅샷을 시각 순으로 병합한다.
+
+    리더가 넘긴 스냅샷은 힙에 쌓였다가, 가장 앞선 스냅샷이 최신 관측 시각보다
+    재정렬 윈도만큼 뒤처지거나 그만큼 오래 대기했을 때 내보낸다. 이중화된
+    소스에서 같은 (심볼, 가격, 거래량) 업데이트가 다시 오면 한 번만 내보낸다.
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, "MarketDataClient"],
+        *,
+        reorder_window_seconds: float,
+        dedupe_size: int,
+    ) -> None:
+        if not sources:
+            raise ValueError("CompositeMarketDataClient requires at least one source.")
+        self._sources = dict(sources)
+        self._window = reorder_window_seconds
+        self._dedupe_size = dedupe_size
+        self._recent: "OrderedDict[Tuple[str, float, float], None]" = OrderedDict()
+        self._lag: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {name: 0 for name in self._sources}
+        self._duplicates = 0
+        self._late = 0
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        symbols = list(symbols)
+        for client in self._sources.values():
+            client.subscribe(symbols)
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        symbols = list(symbols)
+        for client in self._sources.values():
+            client.unsubscribe(symbols)
+
+    def source_lag(self) -> Dict[str, float]:
+        """소스별 최근 스냅샷의 지연(수신 시각 - 스냅샷 시각, 초)."""
+        return dict(self._lag)
+
+    def gap_metrics(self) -> Dict[str, float]:
+        metrics: Dict[str, float] = {
+            "duplicates_dropped": self._duplicates,
+            "late_snapshots": self._late,
+        }
+        for client in self._sources.values():
+            source_metrics = getattr(client, "gap_metrics", None)
+            if source_metrics is None:
+                continue
+            for key, value in source_metrics().items():
+                metrics[key] = metrics.get(key, 0) + value
+        for name, lag in self._lag.items():
+            metrics[f"lag_seconds.{name}"] = lag
+        for name, count in self._counts.items():
+            metrics[f"received.{name}"] = count
+        return metrics
+
+    def stream_ticker(
+        self, symbols: Iterable[str], stop_event: ThreadEvent | None = None
+    ) -> Iterator[MarketSnapshot]:
+        symbols = list(symbols)
+        inbox: "queue.Queue[Tuple[str, MarketSnapshot]]" = queue.Queue()
+        reader_stop = threading.Event()
+
+        def read(name: str, client: "MarketDataClient") -> None:
+            try:
+                for snapshot in client.stream_ticker(symbols, stop_event=reader_stop):
+                    inbox.put((name, snapshot))
+                    if reader_stop.is_set():
+                        break
+            except Exception:
+                logger.exception("Market data source %s stopped.", name)
+
+        readers = [
+            threading.Thread(target=read, args=(name, client), name=f"source-{name}", daemon=True)
+            for name, client in self._sources.items()
+        ]
+        for reader in readers:
+            reader.start()
+
+        heap: List[_HeapEntry] = []
+        sequence = itertools.count()
+        watermark: Optional[datetime] = None
+        last_emitted: Optional[datetime] = None
+        poll_timeout = max(self._window / 2, 0.05)
+
+        try:
+            while not (stop_event and stop_event.is_set()):
+                try:
+                    name, snapshot = inbox.get(timeout=poll_timeout)
+                except queue.Empty:
+                    if not heap and not any(reader.is_alive() for reader in readers):
+                        break
+                else:
+                    self._record_arrival(name, snapshot)
+                    heapq.heappush(
+                        heap,
+                        (snapshot.timestamp, next(sequence), time.monotonic(), name, snapshot),
+                    )
+                    if watermark is None or snapshot.timestamp > watermark:
+                        watermark = snapshot.timestamp
+
+                now = time.monotonic()
+                while heap and (
+                    (watermark - heap[0][0]).total_seconds() >= self._window
+                    or now - heap[0][2] >= self._window
+                ):
+                    timestamp, _, _, _, snapshot = heapq.heappop(heap)
+                    if self._is_duplicate(snapshot):
+                        continue
+                    if last_emitted is not None and timestamp < last_emitted:
+                        self._late += 1
+                    else:
+                        last_emitted = timestamp
+                    yield snapshot
+        finally:
+            reader_stop.set()
+
+    def _record_arrival(self, name: str, snapshot: MarketSnapshot) -> None:
+        self._counts[name] += 1
+        self._lag[name] = (datetime.utcnow() - snapshot.timestamp).total_seconds()
+
+    def _is_duplicate(self, snapshot: MarketSnapshot) -> bool:
+        key = (snapshot.symbol.upper(), snapshot.price, snapshot.volume)
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            self._duplicates += 1
+            return True
+        self._recent[key] = None
+        if len(self._recent) > self._dedupe_size:
+            self._recent.popitem(last=False)
+        return False
+
+
+def create_composite_client() -> CompositeMarketDataClient:
+    from watcher.clients import build_client
+
+    sources = {name: build_client(name) for name in settings.COMPOSITE_SOURCES}
+    return CompositeMarketDataClient(
+        sources,
+        reorder_window_seconds=settings.COMPOSITE_REORDER_WINDOW.total_seconds(),
+        dedupe_size=settings.COMPOSITE_DEDUPE_SIZE,
+    )
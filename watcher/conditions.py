@@ -1,4 +1,5 @@
-from typing import Callable, Optional
+import math
+from typing import Callable, List, Optional
 
 from config import settings
 from watcher.models import Event, EventType, MarketSnapshot
@@ -51,8 +52,172 @@ def volume_spike_condition(
     return None
 
 
+def vwap_deviation_condition(
+    current: MarketSnapshot, previous: MarketSnapshot
+) -> Optional[Event]:
+    features = current.features
+    if features is None or features.ticks < settings.INDICATOR_WARMUP_TICKS:
+        return None
+    zscore = features.vwap_zscore
+    if abs(zscore) >= settings.VWAP_DEVIATION_SIGMA:
+        return Event(
+            symbol=current.symbol,
+            event_type=EventType.VWAP_DEVIATION,
+            snapshot=current,
+            change_metrics={"vwap_zscore": zscore, "vwap": features.vwap},
+            triggered_at=current.timestamp,
+        )
+    return None
+
+
+def spread_blowout_condition(
+    current: MarketSnapshot, previous: MarketSnapshot
+) -> Optional[Event]:
+    """스프레드가 직전 틱에는 임계값 미만이었다가 이번 틱에 넘어설 때만 발생한다."""
+    book, before = current.book, previous.book
+    if book is None or before is None:
+        return None
+    spread_bps = book.spread_bps
+    previous_bps = before.spread_bps
+    if spread_bps >= settings.MAX_SPREAD_BPS > previous_bps:
+        return Event(
+            symbol=current.symbol,
+            event_type=EventType.SPREAD_BLOWOUT,
+            snapshot=current,
+            change_metrics={"spread_bps": spread_bps, "previous_spread_bps": previous_bps},
+            triggered_at=current.timestamp,
+        )
+    return None
+
+
+def book_imbalance_condition(
+    current: MarketSnapshot, previous: MarketSnapshot
+) -> Optional[Event]:
+    """호가 불균형이 임계값을 새로 넘거나 우위 방향이 뒤집힐 때만 발생한다."""
+    book, before = current.book, previous.book
+    if book is None or before is None:
+        return None
+    imbalance = book.imbalance
+    threshold = settings.BOOK_IMBALANCE_THRESHOLD
+    if abs(imbalance) < threshold:
+        return None
+    previous_imbalance = before.imbalance
+    if abs(previous_imbalance) >= threshold and (previous_imbalance > 0) == (imbalance > 0):
+        return None
+    return Event(
+        symbol=current.symbol,
+        event_type=EventType.BOOK_IMBALANCE,
+        snapshot=current,
+        change_metrics={
+            "book_imbalance": imbalance,
+            "previous_book_imbalance": previous_imbalance,
+            "bid_depth": book.bid_depth,
+            "ask_depth": book.ask_depth,
+        },
+        triggered_at=current.timestamp,
+    )
+
+
+def bid_depth_drop_condition(
+    current: MarketSnapshot, previous: MarketSnapshot
+) -> Optional[Event]:
+    """상위 N호가 매수 잔량이 직전 틱 대비 급감하면(매수벽 철수) 발생한다."""
+    book, before = current.book, previous.book
+    if book is None or before is None or before.bid_depth <= 0:
+        return None
+    change = (book.bid_depth - before.bid_depth) / before.bid_depth * 100
+    if change <= -settings.BID_DEPTH_DROP_PERCENT:
+        return Event(
+            symbol=current.symbol,
+            event_type=EventType.BID_DEPTH_DROP,
+            snapshot=current,
+            change_metrics={
+                "bid_depth_change_pct": change,
+                "bid_depth": book.bid_depth,
+                "previous_bid_depth": before.bid_depth,
+            },
+            triggered_at=current.timestamp,
+        )
+    return None
+
+
+def adaptive_price_drop_condition(
+    current: MarketSnapshot, previous: MarketSnapshot
+) -> Optional[Event]:
+    threshold = current.features.adaptive_drop_threshold if current.features else math.nan
+    if math.isnan(threshold):
+        return None
+    change = current.percent_change(previous)
+    if change < 0 and change <= threshold:
+        return Event(
+            symbol=current.symbol,
+            event_type=EventType.PRICE_DROP,
+            snapshot=current,
+            change_metrics={"price_change_pct": change, "adaptive_threshold": threshold},
+            triggered_at=current.timestamp,
+        )
+    return None
+
+
+def adaptive_price_rise_condition(
+    current: MarketSnapshot, previous: MarketSnapshot
+) -> Optional[Event]:
+    threshold = current.features.adaptive_rise_threshold if current.features else math.nan
+    if math.isnan(threshold):
+        return None
+    change = current.percent_change(previous)
+    if change > 0 and change >= threshold:
+        return Event(
+            symbol=current.symbol,
+            event_type=EventType.PRICE_RISE,
+            snapshot=current,
+            change_metrics={"price_change_pct": change, "adaptive_threshold": threshold},
+            triggered_at=current.timestamp,
+        )
+    return None
+
+
+def adaptive_volume_spike_condition(
+    current: MarketSnapshot, previous: MarketSnapshot
+) -> Optional[Event]:
+    threshold = current.features.adaptive_volume_threshold if current.features else math.nan
+    if math.isnan(threshold):
+        return None
+    multiple = current.volume_ratio(previous)
+    if multiple > 1 and multiple >= threshold:
+        return Event(
+            symbol=current.symbol,
+            event_type=EventType.VOLUME_SPIKE,
+            snapshot=current,
+            change_metrics={"volume_multiple": multiple, "adaptive_threshold": threshold},
+            triggered_at=current.timestamp,
+        )
+    return None
+
+
 DEFAULT_CONDITIONS = [
     price_drop_condition,
     price_rise_condition,
     volume_spike_condition,
+    vwap_deviation_condition,
+    spread_blowout_condition,
+    book_imbalance_condition,
+    bid_depth_drop_condition,
 ]
+
+ADAPTIVE_CONDITIONS = [
+    adaptive_price_drop_condition,
+    adaptive_price_rise_condition,
+    adaptive_volume_spike_condition,
+    vwap_deviation_condition,
+    spread_blowout_condition,
+    book_imbalance_condition,
+    bid_depth_drop_condition,
+]
+
+
+def build_conditions() -> List[Condition]:
+    """`settings.CONDITION_MODE`에 맞는 기본 조건 목록을 반환한다."""
+    if settings.CONDITION_MODE.lower() == "adaptive":
+        return list(ADAPTIVE_CONDITIONS)
+    return list(DEFAULT_CONDITIONS)
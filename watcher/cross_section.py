@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from config import settings
+from watcher.models import Event, EventType, MarketSnapshot
+
+MARKET_SYMBOL = "MARKET"
+
+
+class CrossSectionalMonitor:
+    """감시 중인 전체 심볼의 최신 수익률 벡터로 시장 전체 움직임을 감지한다.
+
+    심볼별 윈도 수익률, 하락/상승 심볼 수, 기준 심볼 대비 베타·상관계수를
+    틱마다 증분 갱신하므로 틱당 비용은 (분할 상환) O(1)이다. 베타의 기준 수익률은
+    심볼의 직전 틱 이후 기준 심볼 가격 변화(`ref_now / ref_at_last - 1`)로 짝지어,
+    두 심볼의 틱 간격이 달라도 같은 구간의 수익률을 비교한다.
+    """
+
+    _COLUMNS = (
+        "window_return",
+        "last_price",
+        "ref_at_last",  # 심볼이 마지막으로 갱신될 때의 기준 심볼 가격
+        "mean_ref",
+        "mean_own",
+        "cov",
+        "var_ref",
+        "var_own",
+        "beta",
+        "correlation",
+    )
+    # 체크포인트에는 베타/상관계수 통계만 남긴다. 윈도 수익률·방향은 재시작 후 다시 쌓인다.
+    _PERSISTED_COLUMNS = ("mean_ref", "mean_own", "cov", "var_ref", "var_own", "beta", "correlation")
+
+    def __init__(
+        self,
+        *,
+        reference_symbol: str | None = None,
+        window_seconds: float | None = None,
+        move_percent: float | None = None,
+        breadth_threshold: float | None = None,
+        min_symbols: int | None = None,
+        beta_span: int | None = None,
+    ) -> None:
+        self._reference = (reference_symbol or settings.MARKET_REFERENCE_SYMBOL).upper()
+        self._window = window_seconds or settings.MARKET_WINDOW.total_seconds()
+        self._move = move_percent or settings.MARKET_MOVE_PERCENT
+        self._breadth_threshold = breadth_threshold or settings.MARKET_BREADTH_THRESHOLD
+        self._min_symbols = min_symbols or settings.MARKET_MIN_SYMBOLS
+        self._alpha = 2.0 / ((beta_span or settings.MARKET_BETA_SPAN) + 1.0)
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._windows: List[Deque[Tuple[float, float]]] = []
+        self._direction = array("b")  # -1 하락, 0 보합, 1 상승
+        self._has_beta = array("b")
+        for column in self._COLUMNS:
+            setattr(self, f"_{column}", array("d"))
+        self._reference_price = 0.0
+        self._down = 0
+        self._up = 0
+        self._return_sum = 0.0
+        self._beta_sum = 0.0
+        self._correlation_sum = 0.0
+        self._beta_count = 0
+        self._active = 0
+
+    @property
+    def active_direction(self) -> int:
+        """시장 전체 이벤트가 진행 중이면 방향(-1/1), 아니면 0."""
+        return self._active
+
+    def breadth(self) -> Tuple[float, float]:
+        count = len(self._slots)
+        if count == 0:
+            return 0.0, 0.0
+        return self._down / count, self._up / count
+
+    def beta(self, symbol: str) -> Optional[float]:
+        index = self._slots.get(symbol.upper())
+        if index is None or not self._has_beta[index]:
+            return None
+        return self._beta[index]
+
+    def symbols(self) -> List[str]:
+        return list(self._slots)
+
+    def export_state(self) -> Dict[str, Any]:
+        """체크포인트용 상태 사본. 틱 윈도는 제외하고 배열 복사만 한다."""
+        return {
+            "slots": dict(self._slots),
+            "free": list(self._free),
+            "has_beta": self._has_beta[:],
+            "beta_sum": self._beta_sum,
+            "correlation_sum": self._correlation_sum,
+            "beta_count": self._beta_count,
+            "columns": {
+                column: getattr(self, f"_{column}")[:] for column in self._PERSISTED_COLUMNS
+            },
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        has_beta = array("b", state["has_beta"])
+        count = len(has_beta)
+        persisted = {
+            column: array("d", state["columns"][column]) for column in self._PERSISTED_COLUMNS
+        }
+        if any(len(values) != count for values in persisted.values()):
+            raise ValueError("cross-section columns have different lengths")
+        slots = {str(symbol).upper(): int(index) for symbol, index in state["slots"].items()}
+        if any(not 0 <= index < count for index in slots.values()):
+            raise ValueError("cross-section slot out of range")
+
+        self._slots = slots
+        self._free = [int(index) for index in state["free"]]
+        self._windows = [deque() for _ in range(count)]
+        self._direction = array("b", bytes(count))
+        self._has_beta = has_beta
+        for column in self._COLUMNS:
+            setattr(self, f"_{column}", persisted.get(column) or array("d", [0.0] * count))
+        self._reference_price = 0.0
+        self._down = 0
+        self._up = 0
+        self._return_sum = 0.0
+        self._beta_sum = float(state["beta_sum"])
+        self._correlation_sum = float(state["correlation_sum"])
+        self._beta_count = int(state["beta_count"])
+        self._active = 0
+
+    def update(self, snapshot: MarketSnapshot) -> Optional[Event]:
+        """스냅샷 한 건을 반영하고, 시장 전체 움직임이 새로 시작되면 집계 Event를 반환한다."""
+        i = self._slot(snapshot.symbol)
+        price = snapshot.price
+        now = snapshot.timestamp.timestamp()
+
+        window = self._windows[i]
+        window.append((now, price))
+        while window[0][0] < now - self._window:
+            window.popleft()
+        base = window[0][1]
+        window_return = (price - base) / base * 100 if base else 0.0
+        self._return_sum += window_return - self._window_return[i]
+        self._window_return[i] = window_return
+        self._update_direction(i, window_return)
+
+        previous_price = self._last_price[i]
+        self._last_price[i] = price
+        if snapshot.symbol.upper() == self._reference:
+            self._reference_price = price
+        else:
+            reference_price = self._reference_price
+            reference_before = self._ref_at_last[i]
+            if previous_price > 0 and reference_before > 0:
+                self._update_beta(
+                    i, reference_price / reference_before - 1, price / previous_price - 1
+                )
+            self._ref_at_last[i] = reference_price
+
+        return self._check_market_move(snapshot)
+
+    def _slot(self, symbol: str) -> int:
+        symbol = symbol.upper()
+        index = self._slots.get(symbol)
+        if index is None:
+            if self._free:
+                index = self._free.pop()
+            else:
+                index = len(self._windows)
+                self._windows.append(deque())
+                self._direction.append(0)
+                self._has_beta.append(0)
+                for column in self._COLUMNS:
+                    getattr(self, f"_{column}").append(0.0)
+            self._slots[symbol] = index
+        return index
+
+    def remove(self, symbol: str) -> None:
+        """심볼을 집계에서 빼고 슬롯을 초기화해 재사용 목록에 넣는다."""
+        symbol = symbol.upper()
+        index = self._slots.pop(symbol, None)
+        if index is None:
+            return
+        self._update_direction(index, 0.0)
+        self._return_sum -= self._window_return[index]
+        if self._has_beta[index]:
+            self._beta_count -= 1
+            self._beta_sum -= self._beta[index]
+            self._correlation_sum -= self._correlation[index]
+            self._has_beta[index] = 0
+        if symbol == self._reference:
+            self._reference_price = 0.0
+        self._windows[index] = deque()
+        for column in self._COLUMNS:
+            getattr(self, f"_{column}")[index] = 0.0
+        self._free.append(index)
+
+    def _update_direction(self, i: int, window_return: float) -> None:
+        if window_return <= -self._move:
+            direction = -1
+        elif window_return >= self._move:
+            direction = 1
+        else:
+            direction = 0
+        previous = self._direction[i]
+        if previous == direction:
+            return
+        if previous == -1:
+            self._down -= 1
+        elif previous == 1:
+            self._up -= 1
+        if direction == -1:
+            self._down += 1
+        elif direction == 1:
+            self._up += 1
+        self._direction[i] = direction
+
+    def _update_beta(self, i: int, ref_return: float, own_return: float) -> None:
+        a = self._alpha
+        d_ref = ref_return - self._mean_ref[i]
+        d_own = own_return - self._mean_own[i]
+        self._mean_ref[i] += a * d_ref
+        self._mean_own[i] += a * d_own
+        self._cov[i] = (1 - a) * (self._cov[i] + a * d_ref * d_own)
+        self._var_ref[i] = (1 - a) * (self._var_ref[i] + a * d_ref * d_ref)
+        self._var_own[i] = (1 - a) * (self._var_own[i] + a * d_own * d_own)
+
+        beta = self._cov[i] / self._var_ref[i] if self._var_ref[i] > 0 else 0.0
+        denominator = math.sqrt(self._var_ref[i] * self._var_own[i])
+        correlation = self._cov[i] / denominator if denominator > 0 else 0.0
+        if not self._has_beta[i]:
+            self._has_beta[i] = 1
+            self._beta_count += 1
+        self._beta_sum += beta - self._beta[i]
+        self._correlation_sum += correlation - self._correlation[i]
+        self._beta[i] = beta
+        self._correlation[i] = correlation
+
+    def _check_market_move(self, snapshot: MarketSnapshot) -> Optional[Event]:
+        count = len(self._slots)
+        if count < self._min_symbols:
+            return None
+        down, up = self.breadth()
+        if down >= self._breadth_threshold:
+            direction, share = -1, down
+        elif up >= self._breadth_threshold:
+            direction, share = 1, up
+        else:
+            self._active = 0
+            return None
+        if self._active == direction:
+            return None
+        self._active = direction
+
+        metrics = {
+            "breadth": share,
+            "direction": float(direction),
+            "mean_return_pct": self._return_sum / count,
+            "symbols": float(count),
+        }
+        if self._beta_count:
+            metrics["mean_beta"] = self._beta_sum / self._beta_count
+            metrics["mean_correlation"] = self._correlation_sum / self._beta_count
+        return Event(
+            symbol=MARKET_SYMBOL,
+            event_type=EventType.MARKET_WIDE_MOVE,
+            snapshot=snapshot,
+            change_metrics=metrics,
+            triggered_at=snapshot.timestamp,
+        )
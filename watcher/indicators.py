@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from config import settings
+from watcher.models import MarketSnapshot
+from watcher.quantiles import P2Quantile
+
+_NAN = float("nan")
+
+
+def _alpha(span: int) -> float:
+    return 2.0 / (span + 1.0)
+
+
+class IndicatorEngine:
+    """심볼별 기술 지표를 틱마다 O(1) 시간/메모리로 갱신한다.
+
+    지표 상태는 심볼 슬롯 인덱스로 접근하는 `array('d')` 컬럼에 저장되며,
+    조건 함수는 틱마다 만들어지는 불변 `FeatureView` 값을 받는다.
+
+    VWAP과 거래량 z-score는 틱 사이 체결량으로 가중한다. 스냅샷 volume이
+    24시간 누적치(`cumulative_volume`)면 직전 값과의 증가분 `max(v - last_v, 0)`을
+    쓰고, 봉/구간 거래량이면 그대로 쓴다.
+    """
+
+    _COLUMNS = (
+        "last_price",
+        "last_volume",
+        "last_traded",
+        "ema",
+        "vwap_pv",
+        "vwap_v",
+        "vwap_dev_var",
+        "volume_mean",
+        "volume_var",
+        "return_var",
+        "avg_gain",
+        "avg_loss",
+        "ticks",
+        "drop_threshold",
+        "rise_threshold",
+        "volume_threshold",
+    )
+
+    def __init__(
+        self,
+        *,
+        ema_span: int | None = None,
+        vwap_span: int | None = None,
+        volume_span: int | None = None,
+        volatility_span: int | None = None,
+        rsi_period: int | None = None,
+    ) -> None:
+        self._ema_alpha = _alpha(ema_span or settings.INDICATOR_EMA_SPAN)
+        self._vwap_alpha = _alpha(vwap_span or settings.INDICATOR_VWAP_SPAN)
+        self._volume_alpha = _alpha(volume_span or settings.INDICATOR_VOLUME_SPAN)
+        self._volatility_alpha = _alpha(volatility_span or settings.INDICATOR_VOLATILITY_SPAN)
+        self._rsi_alpha = 1.0 / (rsi_period or settings.INDICATOR_RSI_PERIOD)
+        self._quantile_levels = (
+            settings.ADAPTIVE_DROP_PERCENTILE,
+            settings.ADAPTIVE_RISE_PERCENTILE,
+            settings.ADAPTIVE_VOLUME_PERCENTILE,
+        )
+        self._sketches: List[Tuple[P2Quantile, P2Quantile, P2Quantile]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        for column in self._COLUMNS:
+            setattr(self, f"_{column}", array("d"))
+
+    def slot(self, symbol: str) -> int:
+        index = self._slots.get(symbol)
+        if index is None:
+            drop, rise, volume = self._quantile_levels
+            sketches = (P2Quantile(drop), P2Quantile(rise), P2Quantile(volume))
+            if self._free:
+                index = self._free.pop()
+                for column in self._COLUMNS:
+                    getattr(self, f"_{column}")[index] = 0.0
+                self._sketches[index] = sketches
+            else:
+                index = len(self._sketches)
+                for column in self._COLUMNS:
+                    getattr(self, f"_{column}").append(0.0)
+                self._sketches.append(sketches)
+            self._slots[symbol] = index
+            self._drop_threshold[index] = _NAN
+            self._rise_threshold[index] = _NAN
+            self._volume_threshold[index] = _NAN
+        return index
+
+    def symbols(self) -> List[str]:
+        return list(self._slots)
+
+    def remove(self, symbol: str) -> None:
+        """심볼 슬롯을 해제해 다음에 추가되는 심볼이 재사용하게 한다."""
+        index = self._slots.pop(symbol, None)
+        if index is not None:
+            self._free.append(index)
+
+    def export_state(self) -> Dict[str, Any]:
+        """체크포인트용 상태 사본. 배열 복사만 하므로 감시 루프에서 호출해도 가볍다."""
+        sketches = array("d")
+        for triple in self._sketches:
+            for sketch in triple:
+                sketch.export_into(sketches)
+        return {
+            "slots": dict(self._slots),
+            "free": list(self._free),
+            "levels": list(self._quantile_levels),
+            "columns": {column: getattr(self, f"_{column}")[:] for column in self._COLUMNS},
+            "sketches": sketches,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        slots = {str(symbol): int(index) for symbol, index in state["slots"].items()}
+        columns = {column: array("d", state["columns"][column]) for column in self._COLUMNS}
+        count = len(columns["ticks"])
+        if any(len(values) != count for values in columns.values()):
+            raise ValueError("indicator columns have different lengths")
+        if any(not 0 <= index < count for index in slots.values()):
+            raise ValueError("indicator slot out of range")
+
+        size = P2Quantile.STATE_SIZE
+        values = state["sketches"]
+        drop, rise, volume = self._quantile_levels
+        if tuple(state["levels"]) == self._quantile_levels and len(values) == count * 3 * size:
+            sketches = [
+                tuple(
+                    P2Quantile.from_state(level, values[(i * 3 + k) * size : (i * 3 + k + 1) * size])
+                    for k, level in enumerate(self._quantile_levels)
+                )
+                for i in range(count)
+            ]
+        else:
+            sketches = [
+                (P2Quantile(drop), P2Quantile(rise), P2Quantile(volume)) for _ in range(count)
+            ]
+            for column in ("drop_threshold", "rise_threshold", "volume_threshold"):
+                columns[column] = array("d", [_NAN] * count)
+        self._slots = slots
+        self._free = list(state.get("free", []))
+        for column, values in columns.items():
+            setattr(self, f"_{column}", values)
+        self._sketches = sketches
+
+    def view(self, symbol: str) -> "FeatureView":
+        return self._features(self.slot(symbol))
+
+    def update(self, snapshot: MarketSnapshot) -> "FeatureView":
+        """스냅샷 한 건으로 해당 심볼의 지표를 갱신하고 이 시점의 FeatureView를 반환한다."""
+        i = self.slot(snapshot.symbol)
+        price = snapshot.price
+        volume = snapshot.volume
+
+        if self._ticks[i] == 0:
+            traded = 0.0 if snapshot.cumulative_volume else volume
+            self._last_price[i] = price
+            self._last_volume[i] = volume
+            self._last_traded[i] = traded
+            self._ema[i] = price
+            self._vwap_pv[i] = price * traded
+            self._vwap_v[i] = traded
+            self._volume_mean[i] = traded
+            self._ticks[i] = 1.0
+            return self._features(i)
+
+        if snapshot.cumulative_volume:
+            traded = max(volume - self._last_volume[i], 0.0)
+        else:
+            traded = volume
+
+        a = self._ema_alpha
+        self._ema[i] += a * (price - self._ema[i])
+
+        a = self._vwap_alpha
+        self._vwap_pv[i] += a * (price * traded - self._vwap_pv[i])
+        self._vwap_v[i] += a * (traded - self._vwap_v[i])
+        vwap = self._vwap_pv[i] / self._vwap_v[i] if self._vwap_v[i] > 0 else price
+        deviation = price - vwap
+        self._vwap_dev_var[i] += a * (deviation * deviation - self._vwap_dev_var[i])
+
+        a = self._volume_alpha
+        delta = traded - self._volume_mean[i]
+        self._volume_mean[i] += a * delta
+        self._volume_var[i] = (1 - a) * (self._volume_var[i] + a * delta * delta)
+
+        previous_price = self._last_price[i]
+        self._update_quantiles(i, price, volume)
+        if previous_price > 0 and price > 0:
+            log_return = math.log(price / previous_price)
+            a = self._volatility_alpha
+            self._return_var[i] += a * (log_return * log_return - self._return_var[i])
+
+        a = self._rsi_alpha
+        move = price - previous_price
+        self._avg_gain[i] += a * (max(move, 0.0) - self._avg_gain[i])
+        self._avg_loss[i] += a * (max(-move, 0.0) - self._avg_loss[i])
+
+        self._last_price[i] = price
+        self._last_volume[i] = volume
+        self._last_traded[i] = traded
+        self._ticks[i] += 1.0
+        return self._features(i)
+
+    def _features(self, i: int) -> "FeatureView":
+        price = self._last_price[i]
+        vwap = self._vwap_pv[i] / self._vwap_v[i] if self._vwap_v[i] > 0 else price
+        vwap_std = math.sqrt(self._vwap_dev_var[i])
+        volume_std = math.sqrt(self._volume_var[i])
+        gain = self._avg_gain[i]
+        loss = self._avg_loss[i]
+        if loss == 0:
+            rsi = 100.0 if gain > 0 else 50.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+        return FeatureView(
+            ticks=int(self._ticks[i]),
+            ema=self._ema[i],
+            vwap=vwap,
+            vwap_zscore=(price - vwap) / vwap_std if vwap_std else 0.0,
+            volume_zscore=(
+                (self._last_traded[i] - self._volume_mean[i]) / volume_std if volume_std else 0.0
+            ),
+            realized_volatility=math.sqrt(self._return_var[i]) * 100,
+            rsi=rsi,
+            adaptive_drop_threshold=self._drop_threshold[i],
+            adaptive_rise_threshold=self._rise_threshold[i],
+            adaptive_volume_threshold=self._volume_threshold[i],
+        )
+
+    def _update_quantiles(self, i: int, price: float, volume: float) -> None:
+        """현재 틱을 반영하기 전의 분위수를 임계값으로 고정한 뒤 스케치를 갱신한다."""
+        drop, rise, volume_sketch = self._sketches[i]
+        if drop.count >= settings.ADAPTIVE_MIN_SAMPLES:
+            self._drop_threshold[i] = drop.value()
+            self._rise_threshold[i] = rise.value()
+            self._volume_threshold[i] = volume_sketch.value()
+
+        previous_price = self._last_price[i]
+        previous_volume = self._last_volume[i]
+        if previous_price > 0:
+            change_pct = (price - previous_price) / previous_price * 100
+            drop.add(change_pct)
+            rise.add(change_pct)
+        if previous_volume > 0:
+            volume_sketch.add(volume / previous_volume)
+
+
+class FeatureView(NamedTuple):
+    """한 틱 시점의 지표 값. 스냅샷에 붙어 이벤트와 함께 보관돼도 이후 틱에 바뀌지 않는다.
+
+    틱마다 만들어지므로 frozen dataclass보다 생성 비용이 작은 NamedTuple을 쓴다.
+    """
+
+    ticks: int
+    ema: float
+    vwap: float
+    vwap_zscore: float  # VWAP 대비 현재가 편차(σ 단위)
+    volume_zscore: float  # 틱 사이 체결량 기준
+    realized_volatility: float  # 틱 로그수익률의 지수가중 표준편차(%)
+    rsi: float
+    adaptive_drop_threshold: float  # Δ% 하위 분위수 임계값. 표본이 부족하면 NaN
+    adaptive_rise_threshold: float  # Δ% 상위 분위수 임계값. 표본이 부족하면 NaN
+    adaptive_volume_threshold: float  # 거래량 배수 상위 분위수 임계값. 표본이 부족하면 NaN
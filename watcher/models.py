@@ -1,13 +1,23 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from watcher.bars import Bar
+    from watcher.indicators import FeatureView
+    from watcher.orderbook import BookView
 
 
 class EventType(str, Enum):
     PRICE_DROP = "PRICE_DROP"
     PRICE_RISE = "PRICE_RISE"
     VOLUME_SPIKE = "VOLUME_SPIKE"
+    VWAP_DEVIATION = "VWAP_DEVIATION"
+    SPREAD_BLOWOUT = "SPREAD_BLOWOUT"
+    BOOK_IMBALANCE = "BOOK_IMBALANCE"
+    BID_DEPTH_DROP = "BID_DEPTH_DROP"
+    MARKET_WIDE_MOVE = "MARKET_WIDE_MOVE"
 
 
 @dataclass
@@ -16,6 +26,13 @@ class MarketSnapshot:
     price: float
     volume: float
     timestamp: datetime
+    features: Optional["FeatureView"] = field(default=None, repr=False, compare=False)
+    bar: Optional["Bar"] = field(default=None, repr=False, compare=False)
+    book: Optional["BookView"] = field(default=None, repr=False, compare=False)
+    # True when the comparison with the previous snapshot spans a stream outage.
+    gap: bool = field(default=False, compare=False)
+    # True when volume is a rolling 24h total (Binance ticker) rather than per-interval volume.
+    cumulative_volume: bool = field(default=False, compare=False)
 
     def percent_change(self, previous: "MarketSnapshot") -> float:
         if previous.price == 0:
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+PriceLevel = Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class BookView:
+    """특정 시점 호가창 상단의 불변 요약. 스냅샷에 붙여 조건에서 사용한다."""
+
+    symbol: str
+    best_bid: float
+    best_ask: float
+    bid_depth: float
+    ask_depth: float
+    levels: int
+
+    @property
+    def mid(self) -> float:
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def spread(self) -> float:
+        return self.best_ask - self.best_bid
+
+    @property
+    def spread_bps(self) -> float:
+        mid = self.mid
+        if mid == 0:
+            return 0.0
+        return self.spread / mid * 10_000
+
+    @property
+    def imbalance(self) -> float:
+        """상위 N호가 매수/매도 잔량 불균형(-1~1). 양수면 매수 우위."""
+        total = self.bid_depth + self.ask_depth
+        if total == 0:
+            return 0.0
+        return (self.bid_depth - self.ask_depth) / total
+
+
+class BookSide:
+    """가격 오름차순으로 정렬된 배열 기반 호가 한쪽 면."""
+
+    __slots__ = ("_prices", "_quantities", "_descending")
+
+    def __init__(self, *, descending: bool) -> None:
+        self._prices = array("d")
+        self._quantities = array("d")
+        self._descending = descending
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def clear(self) -> None:
+        del self._prices[:]
+        del self._quantities[:]
+
+    def set(self, price: float, quantity: float) -> None:
+        """수량이 0이면 해당 가격 레벨을 제거한다."""
+        prices = self._prices
+        index = bisect_left(prices, price)
+        exists = index < len(prices) and prices[index] == price
+        if quantity == 0:
+            if exists:
+                del prices[index]
+                del self._quantities[index]
+        elif exists:
+            self._quantities[index] = quantity
+        else:
+            prices.insert(index, price)
+            self._quantities.insert(index, quantity)
+
+    def best(self) -> Optional[float]:
+        if not self._prices:
+            return None
+        return self._prices[-1] if self._descending else self._prices[0]
+
+    def depth(self, levels: int) -> float:
+        quantities = self._quantities
+        if self._descending:
+            return sum(quantities[max(len(quantities) - levels, 0):])
+        return sum(quantities[:levels])
+
+    def top(self, levels: int) -> List[PriceLevel]:
+        if self._descending:
+            start = max(len(self._prices) - levels, 0)
+            return list(zip(reversed(self._prices[start:]), reversed(self._quantities[start:])))
+        return list(zip(self._prices[:levels], self._quantities[:levels]))
+
+
+class OrderBook:
+    """스냅샷 + diff 업데이트로 유지하는 로컬 호가창.
+
+    Binance 규칙을 따른다. 스냅샷의 lastUpdateId 이하 이벤트는 버리고,
+    이후 이벤트의 U는 직전 u + 1이어야 한다. 어긋나면 동기화가 풀리고
+    호출 측이 스냅샷을 다시 받아야 한다.
+    """
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.last_update_id = 0
+        self.synced = False
+
+    def load_snapshot(
+        self,
+        last_update_id: int,
+        bids: Iterable[Sequence[str | float]],
+        asks: Iterable[Sequence[str | float]],
+    ) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        for price, quantity in _levels(bids):
+            self.bids.set(price, quantity)
+        for price, quantity in _levels(asks):
+            self.asks.set(price, quantity)
+        self.last_update_id = last_update_id
+        self.synced = True
+
+    def apply_diff(
+        self,
+        first_update_id: int,
+        final_update_id: int,
+        bids: Iterable[Sequence[str | float]],
+        asks: Iterable[Sequence[str | float]],
+    ) -> bool:
+        """diff 이벤트를 적용한다. 업데이트 ID가 끊기면 False를 반환하고 동기화를 해제한다."""
+        if not self.synced:
+            return False
+        if final_update_id <= self.last_update_id:
+            return True
+        if first_update_id > self.last_update_id + 1:
+            self.synced = False
+            return False
+        for price, quantity in _levels(bids):
+            self.bids.set(price, quantity)
+        for price, quantity in _levels(asks):
+            self.asks.set(price, quantity)
+        self.last_update_id = final_update_id
+        return True
+
+    def view(self, levels: int) -> Optional[BookView]:
+        best_bid = self.bids.best()
+        best_ask = self.asks.best()
+        if not self.synced or best_bid is None or best_ask is None:
+            return None
+        return BookView(
+            symbol=self.symbol,
+            best_bid=best_bid,
+            best_ask=best_ask,
+            bid_depth=self.bids.depth(levels),
+            ask_depth=self.asks.depth(levels),
+            levels=levels,
+        )
+
+
+def _levels(raw: Iterable[Sequence[str | float]]) -> Iterable[PriceLevel]:
+    for level in raw:
+        yield float(level[0]), float(level[1])
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from array import array
+from typing import Sequence
+
+
+class P2Quantile:
+    """P² 알고리즘으로 단일 분위수를 고정 메모리(마커 5개)로 추정한다.
+
+    Jain & Chlamtac(1985)의 방식으로, 관측값을 저장하지 않으므로 워처가
+    얼마나 오래 실행되더라도 심볼당 메모리가 일정하다.
+    """
+
+    __slots__ = ("_p", "_count", "_heights", "_positions", "_desired", "_increments")
+
+    STATE_SIZE = 16  # count + heights(5) + positions(5) + desired(5)
+
+    def __init__(self, p: float) -> None:
+        if not 0.0 < p < 1.0:
+            raise ValueError("quantile must be between 0 and 1 (exclusive)")
+        self._p = p
+        self._count = 0
+        self._heights = array("d", [0.0] * 5)
+        self._positions = array("d", [0.0, 1.0, 2.0, 3.0, 4.0])
+        self._desired = array("d", [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0])
+        self._increments = array("d", [0.0, p / 2, p, (1 + p) / 2, 1.0])
+
+    @property
+    def p(self) -> float:
+        return self._p
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add(self, value: float) -> None:
+        q = self._heights
+        if self._count < 5:
+            q[self._count] = value
+            self._count += 1
+            if self._count == 5:
+                ordered = sorted(q)
+                for i in range(5):
+                    q[i] = ordered[i]
+            return
+
+        self._count += 1
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= q[k + 1]:
+                k += 1
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1.0
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = desired[i] - n[i]
+            if (d >= 1.0 and n[i + 1] - n[i] > 1.0) or (d <= -1.0 and n[i - 1] - n[i] < -1.0):
+                step = 1.0 if d > 0 else -1.0
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    j = i + int(step)
+                    q[i] += step * (q[j] - q[i]) / (n[j] - n[i])
+                n[i] += step
+
+    def export_into(self, out: array) -> None:
+        """체크포인트용으로 상태 STATE_SIZE개 값을 out 뒤에 붙인다."""
+        out.append(float(self._count))
+        out.extend(self._heights)
+        out.extend(self._positions)
+        out.extend(self._desired)
+
+    @classmethod
+    def from_state(cls, p: float, values: Sequence[float]) -> "P2Quantile":
+        if len(values) != cls.STATE_SIZE:
+            raise ValueError("invalid P2 quantile state")
+        sketch = cls(p)
+        sketch._count = int(values[0])
+        sketch._heights = array("d", values[1:6])
+        sketch._positions = array("d", values[6:11])
+        sketch._desired = array("d", values[11:16])
+        return sketch
+
+    def value(self) -> float:
+        """현재 분위수 추정치. 관측값이 없으면 NaN을 반환한다."""
+        if self._count == 0:
+            return float("nan")
+        if self._count < 5:
+            ordered = sorted(self._heights[: self._count])
+            index = min(int(round(self._p * (self._count - 1))), self._count - 1)
+            return ordered[index]
+        return self._heights[2]
+
+    def _parabolic(self, i: int, d: float) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Event as ThreadEvent
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from config import settings
+from watcher.models import MarketSnapshot
+
+if TYPE_CHECKING:
+    import asyncio
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+
+@dataclass(frozen=True)
+class Regime:
+    """틱당 로그수익률 드리프트/변동성과 거래량 수준을 정의하는 시장 국면."""
+
+    drift: float
+    volatility: float
+    volume_multiplier: float
+    volume_volatility: float
+    correlation: Optional[float] = None  # None이면 생성기 기본 상관계수 사용
+
+
+REGIMES: Dict[str, Regime] = {
+    "calm": Regime(drift=0.0, volatility=0.0005, volume_multiplier=1.0, volume_volatility=0.05),
+    "crash": Regime(
+        drift=-0.004, volatility=0.003, volume_multiplier=4.0, volume_volatility=0.3, correlation=0.9
+    ),
+    "spike": Regime(
+        drift=0.004, volatility=0.003, volume_multiplier=4.0, volume_volatility=0.3, correlation=0.9
+    ),
+}
+
+
+def synthetic_symbols(count: int) -> List[str]:
+    return [f"SYN{index:05d}USDT" for index in range(count)]
+
+
+class SyntheticMarketGenerator:
+    """심볼 수천 개의 상관된 랜덤워크 가격·거래량을 NumPy 배치로 생성한다.
+
+    가격은 공통 시장 요인 + 개별 요인의 1-요인 모델로 움직이고, 로그 거래량은
+    국면별 목표 수준으로 평균회귀한다. 같은 seed면 같은 경로를 재현한다.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        *,
+        seed: Optional[int] = None,
+        correlation: float | None = None,
+        initial_price: float = 30000.0,
+        initial_volume: float = 1000.0,
+    ) -> None:
+        if np is None:
+            raise RuntimeError(
+                "numpy is required for the synthetic market generator. "
+                "Install it with `pip install numpy`."
+            )
+        self._rng = np.random.default_rng(seed)
+        self._symbols = list(symbols)
+        self._correlation = settings.SYNTHETIC_CORRELATION if correlation is None else correlation
+        self._initial_price = initial_price
+        self._initial_volume = initial_volume
+        self._log_prices = self._initial_log_prices(len(self._symbols))
+        self._log_volumes = np.full(len(self._symbols), math.log(initial_volume))
+        self._regime = REGIMES["calm"]
+        self._regime_batches: Optional[int] = None
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    @property
+    def regime(self) -> Regime:
+        return self._regime
+
+    def inject_regime(self, name: str, *, batches: Optional[int] = None) -> None:
+        """국면을 바꾼다. batches를 주면 그만큼의 배치 뒤 calm으로 돌아간다."""
+        if name not in REGIMES:
+            raise ValueError(f"Unknown regime: {name}")
+        self._regime = REGIMES[name]
+        self._regime_batches = batches
+
+    def add_symbols(self, symbols: Iterable[str]) -> None:
+        added = [symbol for symbol in symbols if symbol not in self._symbols]
+        if not added:
+            return
+        self._symbols.extend(added)
+        self._log_prices = np.concatenate([self._log_prices, self._initial_log_prices(len(added))])
+        self._log_volumes = np.concatenate(
+            [self._log_volumes, np.full(len(added), math.log(self._initial_volume))]
+        )
+
+    def remove_symbols(self, symbols: Iterable[str]) -> None:
+        targets = set(symbols)
+        keep = np.array([symbol not in targets for symbol in self._symbols], dtype=bool)
+        if keep.all():
+            return
+        self._symbols = [symbol for symbol in self._symbols if symbol not in targets]
+        self._log_prices = self._log_prices[keep]
+        self._log_volumes = self._log_volumes[keep]
+
+    def next_batch(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """모든 심볼의 다음 틱 (가격, 거래량) 배열을 반환한다."""
+        regime = self._regime
+        count = len(self._symbols)
+        rho = self._correlation if regime.correlation is None else regime.correlation
+        market = self._rng.standard_normal()
+        idiosyncratic = self._rng.standard_normal(count)
+        shocks = math.sqrt(rho) * market + math.sqrt(1.0 - rho) * idiosyncratic
+        self._log_prices += regime.drift + regime.volatility * shocks
+
+        target = math.log(self._initial_volume * regime.volume_multiplier)
+        self._log_volumes += 0.2 * (target - self._log_volumes)
+        self._log_volumes += regime.volume_volatility * self._rng.standard_normal(count)
+
+        if self._regime_batches is not None:
+            self._regime_batches -= 1
+            if self._regime_batches <= 0:
+                self._regime = REGIMES["calm"]
+                self._regime_batches = None
+        return np.exp(self._log_prices), np.exp(self._log_volumes)
+
+    def _initial_log_prices(self, count: int) -> "np.ndarray":
+        jitter = self._rng.uniform(-0.5, 0.5, count)
+        return math.log(self._initial_price) + jitter
+
+
+class SyntheticMarketClient:
+    """SyntheticMarketGenerator 배치를 MarketSnapshot 스트림으로 내보내는 부하 테스트용 백엔드.
+
+    target_rate(초당 틱 수)에 맞춰 배치 단위로 속도를 조절하며, 0 또는 None이면
+    대기 없이 최대 속도로 생성한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: Optional[int] = None,
+        target_rate: Optional[float] = None,
+        correlation: float | None = None,
+    ) -> None:
+        if np is None:
+            raise RuntimeError(
+                "numpy is required for the synthetic backend. Install it with `pip install numpy`."
+            )
+        self._seed = seed
+        self._target_rate = target_rate
+        self._correlation = correlation
+        self._pending_regime: Optional[Tuple[str, Optional[int]]] = None
+        self._changes: List[Tuple[str, List[str]]] = []
+        self._lock = threading.Lock()
+
+    def inject_regime(self, name: str, *, batches: Optional[int] = None) -> None:
+        if name not in REGIMES:
+            raise ValueError(f"Unknown regime: {name}")
+        with self._lock:
+            self._pending_regime = (name, batches)
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        with self._lock:
+            self._changes.append(("add", [symbol.upper() for symbol in symbols]))
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        with self._lock:
+            self._changes.append(("remove", [symbol.upper() for symbol in symbols]))
+
+    def stream_ticker(
+        self, symbols: Iterable[str], stop_event: ThreadEvent | None = None
+    ) -> Iterator[MarketSnapshot]:
+        generator = self._generator(symbols)
+        deadline = time.monotonic()
+
+        while not (stop_event and stop_event.is_set()):
+            batch = self._next_snapshots(generator)
+            yield from batch
+            deadline, delay = self._pace(deadline, len(batch))
+            if delay > 0:
+                time.sleep(delay)
+
+    async def stream_ticker_async(
+        self, symbols: Iterable[str], stop_event: asyncio.Event | None = None
+    ) -> AsyncIterator[MarketSnapshot]:
+        import asyncio
+
+        generator = self._generator(symbols)
+        deadline = time.monotonic()
+
+        while not (stop_event and stop_event.is_set()):
+            batch = self._next_snapshots(generator)
+            for snapshot in batch:
+                yield snapshot
+            deadline, delay = self._pace(deadline, len(batch))
+            # 무제한 속도에서도 배치마다 한 번은 이벤트 루프에 양보한다.
+            await asyncio.sleep(max(delay, 0.0))
+
+    def _generator(self, symbols: Iterable[str]) -> SyntheticMarketGenerator:
+        return SyntheticMarketGenerator(
+            list(dict.fromkeys(symbol.upper() for symbol in symbols)),
+            seed=self._seed,
+            correlation=self._correlation,
+        )
+
+    def _next_snapshots(self, generator: SyntheticMarketGenerator) -> List[MarketSnapshot]:
+        self._apply_pending(generator)
+        names = generator.symbols
+        prices, volumes = generator.next_batch()
+        timestamp = datetime.utcnow()
+        return [
+            MarketSnapshot(symbol=symbol, price=price, volume=volume, timestamp=timestamp)
+            for symbol, price, volume in zip(names, prices.tolist(), volumes.tolist())
+        ]
+
+    def _pace(self, deadline: float, count: int) -> Tuple[float, float]:
+        """target_rate 기준 다음 마감 시각과 남은 대기 시간을 반환한다.
+
+        감시 심볼이 없으면 바쁜 대기를 하지 않도록 유휴 간격만큼 쉰다.
+        """
+        if not count:
+            return time.monotonic(), settings.SYNTHETIC_IDLE_INTERVAL
+        if not self._target_rate:
+            return deadline, 0.0
+        deadline += count / self._target_rate
+        delay = deadline - time.monotonic()
+        if delay <= 0:
+            return time.monotonic(), 0.0
+        return deadline, delay
+
+    def _apply_pending(self, generator: SyntheticMarketGenerator) -> None:
+        if not self._changes and self._pending_regime is None:
+            return
+        with self._lock:
+            changes, self._changes = self._changes, []
+            regime, self._pending_regime = self._pending_regime, None
+        for action, symbols in changes:
+            if action == "add":
+                generator.add_symbols(symbols)
+            else:
+                generator.remove_symbols(symbols)
+        if regime is not None:
+            generator.inject_regime(regime[0], batches=regime[1])
+
+
+def create_synthetic_client() -> SyntheticMarketClient:
+    return SyntheticMarketClient(
+        seed=settings.SYNTHETIC_SEED,
+        target_rate=settings.SYNTHETIC_TARGET_RATE,
+    )